@@ -1,76 +1,54 @@
+import time
+STARTED = time.perf_counter()  # Before the other imports, so the startup profile can time them
+
+import logging
 import tkinter as tk
-import random
-import pickle
-from tkinter import messagebox, Canvas, Scrollbar, Frame
-from PIL import Image, ImageTk
-import re
-
-# Updated card packs including Easter Egg packs
-CARD_PACKS = {
-    "Bronze Pack": {"cost": 100, "currency": "coins", "rarity_distribution": {"common": 70, "uncommon": 20, "rare": 10}, "icon_path": "assets/packs/images/bronze_pack_animation.png"},
-    "Silver Pack": {"cost": 200, "currency": "coins", "rarity_distribution": {"common": 10, "uncommon": 30, "rare": 35, "super rare": 25}, "icon_path": "assets/packs/images/silver_pack_animation.png"},
-    "Gold Pack": {"cost": 500, "currency": "coins", "rarity_distribution": {"uncommon": 10, "rare": 40, "super rare": 35, "epic": 15}, "icon_path": "assets/packs/images/gold_pack_animation.png"},
-    "Ruby Pack": {"cost": 1000, "currency": "coins", "rarity_distribution": {"rare": 30, "super rare": 40, "epic": 20, "mythic": 10}, "icon_path": "assets/packs/images/ruby_pack_animation.png"},
-    "Emerald Pack": {"cost": 2000, "currency": "coins", "rarity_distribution": {"super rare": 20, "epic": 40, "mythic": 30, "legendary": 10}, "icon_path": "assets/packs/images/emerald_pack_animation.png"},
-    "Diamond Pack": {"cost": 3000, "currency": "coins", "rarity_distribution": {"epic": 45, "mythic": 25, "legendary": 25, "godlike": 5}, "icon_path": "assets/packs/images/diamond_pack_animation.png"},
-    "Stardust Pack": {"cost": 5000, "currency": "coins", "rarity_distribution": {"legendary": 70, "godlike": 25, "star": 5}, "icon_path": "assets/packs/images/stardust_pack_animation.png"},
-    "Cold Pack": {"cost": 1, "currency": "snow", "rarity_distribution": {"cold common": 70, "cold uncommon": 20, "cold rare": 10}, "icon_path": "assets/packs/images/cold_pack_animation.png"},
-    "Frost Pack": {"cost": 10, "currency": "snow", "rarity_distribution": {"cold uncommon": 40, "cold rare": 40, "cold super rare": 20}, "icon_path": "assets/packs/images/frost_pack_animation.png"},
-    "Ice Pack": {"cost": 25, "currency": "snow", "rarity_distribution": {"cold rare": 30, "cold super rare": 40, "cold epic": 30}, "icon_path": "assets/packs/images/ice_pack_animation.png"},
-    "Snow Pack": {"cost": 75, "currency": "snow", "rarity_distribution": {"cold super rare": 30, "cold epic": 50, "cold mythic": 20}, "icon_path": "assets/packs/images/snow_pack_animation.png"},
-    "Blizzard Pack": {"cost": 150, "currency": "snow", "rarity_distribution": {"cold epic": 40, "cold mythic": 40, "cold legendary": 20}, "icon_path": "assets/packs/images/blizzard_pack_animation.png"},
-    
-    # Easter Egg Packs (hidden packs)
-    "Ollie Pack": {"cost": 0, "currency": "special", "rarity_distribution": {"ollie rare": 50, "ollie epic": 30, "ollie legendary": 20}, "icon_path": "assets/packs/images/ollie_pack_animation.png", "purchasable": False},
-    "Plasma Pack": {"cost": 0, "currency": "special", "rarity_distribution": {"plasma common": 40, "plasma rare": 40, "plasma epic": 20}, "icon_path": "assets/packs/images/plasma_pack_animation.png", "purchasable": False},
-    "Hacker Pack": {"cost": 0, "currency": "special", "rarity_distribution": {"hacker uncommon": 40, "hacker rare": 30, "hacker epic": 20, "hacker mythic": 10}, "icon_path": "assets/packs/images/hacker_pack_animation.png", "purchasable": False},
-}
-
-# Chances for shiny, shadow, and cold cards
-SHINY_CHANCE = 0.10
-SHADOW_CHANCE = 0.01
-COLD_CHANCE = 0.01  # 1% chance from normal packs
-REFUND_CHANCE = 0.05  # 5% chance to get twice the money you spent back
-
-# Easter Egg Chance
-EASTER_EGG_CHANCE = 0.005  # 0.5% chance
-EASTER_EGG_OPTIONS = {
-    "Ollie Pack": 33,
-    "Plasma Pack": 33,
-    "Hacker Pack": 33,
-    "Million Coins": 1,
-}
-
-def save_game(data, filename="savegame.pkl"):
-    """Save game state to a file."""
-    with open(filename, 'wb') as f:
-        pickle.dump(data, f)
-    messagebox.showinfo("Save Game", "Game progress saved successfully!")
-
-def load_game(filename="savegame.pkl"):
-    """Load game state from a file."""
+import os
+from tkinter import messagebox, ttk, Canvas, Scrollbar, Frame
+
+from packsim.config import CARD_PACKS
+from packsim.atlas import ATLAS_INDEX, AtlasAssets
+from packsim.autosave import AutosaveService
+from packsim.background import POLL_MS, BackgroundTask, poll_task
+from packsim.cards import card_name
+from packsim.game import GameError, GameState, COINS_PER_SNOW
+from packsim.instrument import METRICS, METRICS_FILE, configure_logging
+from packsim.journal import Journal
+from packsim.pricing import card_price
+from packsim.rng import ReplayLog, RngService
+from packsim.saves import read_save
+from packsim.screens import ScreenManager
+from packsim.startup import StartupProfile, after_first_paint
+from packsim.widgets import VirtualList
+
+# Recount the card collection after every change to catch ledger drift (slow, for debugging)
+VERIFY_LEDGER = bool(os.environ.get("PACKSIM_VERIFY_LEDGER"))
+
+# A save name ending in ".pksc" uses the memory-mapped columnar format instead of the binary one
+SAVE_FILENAME = os.environ.get("PACKSIM_SAVE_FILE", "savegame.pkl")
+JOURNAL_FILENAME = os.path.splitext(SAVE_FILENAME)[0] + ".journal"
+
+# How many packs the pack list's quantity box starts at (capped by the packs held)
+OPEN_SOME_QUANTITY = 10
+
+# Set PACKSIM_SEED to make a session's rolls repeatable, and PACKSIM_REPLAY_LOG to
+# write the seed and every action to that file on quit (see packsim.rng.ReplayLog)
+SEED = os.environ.get("PACKSIM_SEED")
+REPLAY_LOG_FILENAME = os.environ.get("PACKSIM_REPLAY_LOG")
+
+# Where Stats > Diagnostics writes the metrics if PACKSIM_METRICS_FILE is not set
+DEFAULT_METRICS_FILENAME = "packsim-metrics.json"
+
+log = logging.getLogger("packsim.app")
+
+def load_game(filename=SAVE_FILENAME, progress=None):
+    """Load game state from a file, or return None if there is no save.
+
+    Runs on the loader thread, so it must not show dialogs; progress is passed to read_save.
+    """
     try:
-        with open(filename, 'rb') as f:
-            data = pickle.load(f)
-        messagebox.showinfo("Load Game", "Game progress loaded successfully!")
-
-        # Check if the data contains the new stats, and fill in defaults if not
-        if len(data) == 4:  # Old save file with only 4 values
-            player_currency, player_snow, player_inventory, player_cards = data
-            net_worth = player_currency  # Default net worth calculation
-            total_packs_opened = 0
-            total_cards_sold = 0
-            easter_eggs_found = 0
-            experience_points = 0
-            return (player_currency, player_snow, player_inventory, player_cards,
-                    net_worth, total_packs_opened, total_cards_sold,
-                    easter_eggs_found, experience_points)
-        
-        # If the data contains 9 values, return them directly
-        return data
-
+        return read_save(filename, progress)
     except FileNotFoundError:
-        messagebox.showwarning("Load Game", "No saved game found.")
         return None
 
 class CardGameApp:
@@ -78,184 +56,317 @@ class CardGameApp:
         self.root = root
         self.root.title("Card Pack Opening Game")
         self.root.attributes('-fullscreen', True)
+        self.profile = StartupProfile(STARTED)
+        self.profile.mark("imports")
+
+        # The save loads on a worker thread behind a splash screen (see load_state)
+        self.game = None
+        self.assets = None
+        self.autosave = None
+
+        # Screens are built once and raised on demand; the currency labels sit above them
+        self.screens = ScreenManager(self.root)
+        self.register_screens()
+        self.coins_var = tk.StringVar()
+        self.snow_var = tk.StringVar()  # Label text for Snow currency
+        tk.Label(self.root, textvariable=self.coins_var, font=("Helvetica", 14)).place(relx=0.98, rely=0.02, anchor='ne')
+        tk.Label(self.root, textvariable=self.snow_var, font=("Helvetica", 14)).place(relx=0.98, rely=0.07, anchor='ne')
+        self.coins_var.set("Loading...")
+
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_game)
+        self.screens.show("loading")
+        self.loader = BackgroundTask(self.load_state, name="save-loader").start()
+        after_first_paint(self.root, self.first_frame)
+
+    def load_state(self, report):
+        """Read the save and replay its journal into a new GameState; runs on the loader thread.
+
+        Returns (game, whether a save was found). Nothing here may touch Tk.
+        """
+        def on_read(done, total):
+            report(done, total, "Reading save")
+
+        # All game rules and player stats live in the headless GameState; the app only draws it
+        rng = RngService(int(SEED) if SEED else None)
+        with self.profile.phase("save load"):
+            saved_data = load_game(progress=on_read)
+            if saved_data:
+                game = GameState.from_save(saved_data, rng=rng, verify=VERIFY_LEDGER)
+                journal_seq = saved_data[9]
+            else:
+                game = GameState(rng=rng, verify=VERIFY_LEDGER)
+                journal_seq = 0
+
+            # Replay whatever happened after the snapshot was written
+            report(0, 0, "Replaying journal")
+            game.attach_journal(Journal(JOURNAL_FILENAME), after_seq=journal_seq)
+        return game, saved_data is not None
+
+    def first_frame(self):
+        """Starts loading the pack images once the splash screen is drawn, then waits for the save."""
+        self.profile.mark("first frame")
+        with self.profile.phase("asset load"):
+            self.load_icons()
+        poll_task(self.root, self.loader, self.finish_startup,
+                  on_progress=self.show_load_progress, on_error=self.load_failed)
+
+    def finish_startup(self, loaded):
+        """Takes over the loaded game on the Tk thread and opens the main menu."""
+        self.game, save_found = loaded
+        if REPLAY_LOG_FILENAME:
+            ReplayLog.begin(self.game)
+        # Journal appends and snapshots are written on the autosave thread from here on
+        self.autosave = AutosaveService(self.game, SAVE_FILENAME)
 
-        # Player stats
-        self.player_currency = 180
-        self.player_snow = 0  # New Snow currency
-        self.player_inventory = []
-        self.player_cards = []
-        self.currency_label = None
-        self.snow_label = None  # Label for Snow currency
-
-        # Stats tracking
-        self.net_worth = 180  # Initially, net worth is just the starting coins
-        self.total_packs_opened = 0
-        self.total_cards_sold = 0
-        self.easter_eggs_found = 0
-        self.experience_points = 0
-
-        self.icons = {}
-        self.load_icons()
-
-        saved_data = load_game()
-        if saved_data:
-            (self.player_currency, self.player_snow, self.player_inventory, 
-             self.player_cards, self.net_worth, self.total_packs_opened, 
-             self.total_cards_sold, self.easter_eggs_found, self.experience_points) = saved_data
-
-        self.start_coin_reward_system()
         self.main_menu()
+        self.start_coin_reward_system()
+        self.root.after(60 * 1000, self.auto_save_game)
+        self.profile.mark("ready")
+        self.profile.report()
+        if not save_found:
+            messagebox.showwarning("Load Game", "No saved game found.")
+
+    def load_failed(self, error):
+        """Reports a save that could not be read and closes the game without overwriting it."""
+        log.error("Could not load %s", SAVE_FILENAME, exc_info=error)
+        messagebox.showerror("Load Game", f"Could not load {SAVE_FILENAME}: {error}")
+        self.quit_game()
+
+    def build_loading_screen(self, frame):
+        tk.Label(frame, text="Card Pack Opening Game", font=("Helvetica", 24)).pack(pady=20)
+        self.load_status_var = tk.StringVar(value="Loading...")
+        tk.Label(frame, textvariable=self.load_status_var, font=("Helvetica", 14)).pack(pady=10)
+        self.load_progress = ttk.Progressbar(frame, length=300, maximum=100)
+        self.load_progress.pack(pady=10)
+        tk.Button(frame, text="Exit", width=20, command=self.quit_game).pack(pady=20)
+
+    def show_load_progress(self, done, total, status):
+        """Updates the splash screen from the loader's latest report."""
+        if not status:
+            return
+        if total:
+            self.load_progress.configure(mode="determinate", value=100 * done / total)
+            self.load_status_var.set(f"{status}: {done / 1e6:.1f} of {total / 1e6:.1f} MB")
+        else:
+            # No size to measure against, so just keep the bar moving
+            self.load_progress.configure(mode="indeterminate")
+            self.load_progress.step(5)
+            self.load_status_var.set(f"{status}...")
+
+    @property
+    def player_currency(self):
+        return self.game.coins
+
+    @property
+    def player_snow(self):
+        return self.game.snow
 
-    def update_net_worth(self):
-        """Update the player's net worth based on total coins and the sell price of all cards."""
-        self.net_worth = self.player_currency
-        for card in self.player_cards:
-            self.net_worth += self.get_card_price(card)
+    @property
+    def player_inventory(self):
+        return self.game.packs
+
+    @property
+    def player_cards(self):
+        return self.game.cards
+
+    @property
+    def net_worth(self):
+        """Total coins plus the sell price of all cards, kept current by the ledger."""
+        return self.game.net_worth
 
     def auto_save_game(self):
         """Automatically saves the game every minute without showing a notification."""
-        self.save_progress()
+        # Only the events since the last autosave are written, unless it is time to compact
+        self.autosave.autosave()
         self.root.after(60 * 1000, self.auto_save_game)  # Schedule the next auto-save in 1 minute
 
+    def quit_game(self):
+        """Writes out unsaved journal events and closes the game."""
+        if self.autosave is not None:
+            error = self.autosave.close()
+            if error is not None:
+                messagebox.showerror("Save Game", f"Could not save the game before closing: {error}")
+        if self.game is not None:
+            if self.game.replay_log is not None:
+                self.game.replay_log.save(REPLAY_LOG_FILENAME)
+        if METRICS.enabled and METRICS_FILE:
+            METRICS.dump(METRICS_FILE)
+        if self.assets is not None:
+            self.assets.shutdown()
+        self.root.quit()
+
     def load_icons(self):
-        """Load all the icons required for the game."""
-        for pack_name, pack_info in CARD_PACKS.items():
-            try:
-                image = Image.open(pack_info["icon_path"])
-                image = image.resize((50, 50), Image.LANCZOS)
-                self.icons[pack_name] = ImageTk.PhotoImage(image)
-            except FileNotFoundError:
-                messagebox.showerror("Error", f"Image for {pack_name} not found at {pack_info['icon_path']}")
-
-        # Load animation images for each pack type
-        self.pack_animation_images = {}
-        for pack_name in CARD_PACKS.keys():
-            try:
-                animation_image = Image.open(f"assets/packs/images/{pack_name.lower().replace(' ', '_')}_animation.png")
-                animation_image = animation_image.resize((200, 200), Image.LANCZOS)
-                self.pack_animation_images[pack_name] = ImageTk.PhotoImage(animation_image)
-            except FileNotFoundError:
-                messagebox.showerror("Error", f"Animation image for {pack_name} not found.")
+        """Start loading the pack icons in the background; animations load on first use."""
+        def on_missing(message):
+            messagebox.showerror("Error", message)
+
+        # A prebuilt atlas (python -m packsim.atlas) is one file read and needs no Pillow
+        if os.path.exists(ATLAS_INDEX):
+            self.assets = AtlasAssets(ATLAS_INDEX, on_missing=on_missing)
+        else:
+            from packsim.assets import AssetManager
+            self.assets = AssetManager(CARD_PACKS, on_missing=on_missing)
+        self.assets.preload_icons()
 
     def start_coin_reward_system(self):
         """Awards the player 20 coins every 2 minutes."""
-        self.player_currency += 20
+        self.game.coin_reward()
         self.update_currency_display()
         self.root.after(2 * 60 * 1000, self.start_coin_reward_system)
 
     def update_currency_display(self):
         """Updates the currency display in the top right corner of the window."""
-        # Remove the old labels if they exist
-        if self.currency_label:
-            self.currency_label.destroy()
-        if self.snow_label:
-            self.snow_label.destroy()
-
-        # Create new labels to display the current currency
-        self.currency_label = tk.Label(self.root, text=f"Coins: {self.player_currency}", font=("Helvetica", 14))
-        self.currency_label.place(relx=0.98, rely=0.02, anchor='ne')
-
-        self.snow_label = tk.Label(self.root, text=f"Snow: {self.player_snow}", font=("Helvetica", 14))
-        self.snow_label.place(relx=0.98, rely=0.07, anchor='ne')
-
-    def add_experience(self, points):
-        """Add experience points and update stats."""
-        self.experience_points += points
+        self.coins_var.set(f"Coins: {self.player_currency}")
+        self.snow_var.set(f"Snow: {self.player_snow}")
+
+    def register_screens(self):
+        """Register every screen with the screen manager; each is built on first use."""
+        self.screens.register("loading", self.build_loading_screen)
+        self.screens.register("main", self.build_main_menu)
+        self.screens.register("stats", self.build_stats_menu, self.refresh_stats_menu)
+        self.screens.register("diagnostics", self.build_diagnostics_menu, self.refresh_diagnostics_menu)
+        self.screens.register("convert", self.build_convert_currency_menu)
+        self.screens.register("shop", self.build_shop_menu)
+        self.screens.register("pack_quantity", self.build_pack_quantity_menu)
+        self.screens.register("inventory", self.build_inventory_menu)
+        self.screens.register("packs", self.build_pack_inventory, self.refresh_pack_inventory)
+        self.screens.register("cards", self.build_card_inventory, self.refresh_card_inventory)
+        self.screens.register("market", self.build_market_menu, self.refresh_market_menu)
+        self.screens.register("opening", self.build_opening_screen)
+        self.screens.register("reveal", self.build_reveal_screen)
+        self.screens.register("summary", self.build_summary_screen)
+
+    def show_list(self, virtual_list, empty_label, count):
+        """Show a virtual list with count rows, or its empty label when there are none."""
+        if count:
+            empty_label.pack_forget()
+            virtual_list.pack(fill="both", expand=True, padx=20)
+        else:
+            virtual_list.pack_forget()
+            empty_label.pack(pady=10)
+        virtual_list.set_count(count)
 
     def main_menu(self):
         """Main menu setup."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.update_currency_display()
+        self.screens.show("main")
 
-        tk.Label(self.root, text="Card Pack Opening Game", font=("Helvetica", 24)).pack(pady=20)
+    def build_main_menu(self, frame):
+        tk.Label(frame, text="Card Pack Opening Game", font=("Helvetica", 24)).pack(pady=20)
 
-        tk.Button(self.root, text="Shop", width=20, command=self.shop_menu).pack(pady=10)
-        tk.Button(self.root, text="Inventory", width=20, command=self.inventory_menu).pack(pady=10)
-        tk.Button(self.root, text="Market", width=20, command=self.market_menu).pack(pady=10)
-        tk.Button(self.root, text="Convert Currency", width=20, command=self.convert_currency_menu).pack(pady=10)
-        tk.Button(self.root, text="Save Progress", width=20, command=self.save_progress).pack(pady=10)
-        tk.Button(self.root, text="Stats", width=20, command=self.stats_menu).place(relx=0.02, rely=0.97, anchor='sw')  # Stats button at bottom left
-        tk.Button(self.root, text="Exit", width=20, command=self.root.quit).pack(pady=10)
+        tk.Button(frame, text="Shop", width=20, command=self.shop_menu).pack(pady=10)
+        tk.Button(frame, text="Inventory", width=20, command=self.inventory_menu).pack(pady=10)
+        tk.Button(frame, text="Market", width=20, command=self.market_menu).pack(pady=10)
+        tk.Button(frame, text="Convert Currency", width=20, command=self.convert_currency_menu).pack(pady=10)
+        tk.Button(frame, text="Save Progress", width=20, command=self.save_progress).pack(pady=10)
+        tk.Button(frame, text="Stats", width=20, command=self.stats_menu).place(relx=0.02, rely=0.97, anchor='sw')  # Stats button at bottom left
+        tk.Button(frame, text="Exit", width=20, command=self.quit_game).pack(pady=10)
 
     def stats_menu(self):
         """Display the player's stats."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.update_currency_display()
-
-        tk.Label(self.root, text="Player Stats", font=("Helvetica", 18)).pack(pady=20)
-
-        self.update_net_worth()
-
-        # Display stats
-        stats_text = (
-            f"Net Worth: {self.net_worth} Coins\n"
-            f"Total Packs Opened: {self.total_packs_opened}\n"
-            f"Total Cards Sold: {self.total_cards_sold}\n"
-            f"Easter Eggs Found: {self.easter_eggs_found}\n"
-            f"Experience Points (XP): {self.experience_points}\n"
+        self.screens.show("stats")
+
+    def build_stats_menu(self, frame):
+        tk.Label(frame, text="Player Stats", font=("Helvetica", 18)).pack(pady=20)
+        self.stats_var = tk.StringVar()
+        tk.Label(frame, textvariable=self.stats_var, font=("Helvetica", 14)).pack(pady=20)
+        tk.Button(frame, text="Diagnostics", width=20, command=self.diagnostics_menu).pack(pady=5)
+        tk.Button(frame, text="Back", width=20, command=self.main_menu).pack(pady=20)
+
+    def refresh_stats_menu(self):
+        game = self.game
+        if game.ledger.verify:
+            game.ledger.check()
+
+        self.stats_var.set(
+            f"Net Worth: {game.net_worth} Coins\n"
+            f"Total Packs Opened: {game.total_packs_opened}\n"
+            f"Total Cards Sold: {game.total_cards_sold}\n"
+            f"Easter Eggs Found: {game.easter_eggs_found}\n"
+            f"Experience Points (XP): {game.experience_points}\n"
         )
-        tk.Label(self.root, text=stats_text, font=("Helvetica", 14)).pack(pady=20)
 
-        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
+    def diagnostics_menu(self):
+        """Show the counters and timings collected with PACKSIM_METRICS=1."""
+        self.screens.show("diagnostics")
+
+    def build_diagnostics_menu(self, frame):
+        tk.Label(frame, text="Diagnostics", font=("Helvetica", 18)).pack(pady=20)
+        buttons = Frame(frame)
+        buttons.pack(side="bottom", pady=20)
+        tk.Button(buttons, text="Refresh", width=12, command=self.refresh_diagnostics_menu).pack(side="left", padx=5)
+        tk.Button(buttons, text="Write to File", width=12, command=self.write_metrics).pack(side="left", padx=5)
+        tk.Button(buttons, text="Back", width=12, command=self.stats_menu).pack(side="left", padx=5)
+
+        body = Frame(frame)
+        body.pack(fill="both", expand=True, padx=20)
+        scroll_y = Scrollbar(body, orient="vertical")
+        self.diagnostics_text = tk.Text(body, font=("Courier", 10), width=70, yscrollcommand=scroll_y.set)
+        scroll_y.configure(command=self.diagnostics_text.yview)
+        scroll_y.pack(side="right", fill="y")
+        self.diagnostics_text.pack(side="left", fill="both", expand=True)
+
+    def refresh_diagnostics_menu(self):
+        self.diagnostics_text.configure(state="normal")
+        self.diagnostics_text.delete("1.0", tk.END)
+        self.diagnostics_text.insert(tk.END, "\n".join(METRICS.report_lines()))
+        self.diagnostics_text.configure(state="disabled")
+
+    def write_metrics(self):
+        """Write the collected metrics to a JSON file."""
+        filename = METRICS_FILE or DEFAULT_METRICS_FILENAME
+        try:
+            METRICS.dump(filename)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not write {filename}: {e}")
+            return
+        log.info("Wrote metrics to %s", filename)
+        messagebox.showinfo("Diagnostics", f"Metrics written to {filename}.")
 
     def convert_currency_menu(self):
         """Menu to convert between Coins and Snow."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.update_currency_display()
+        self.screens.show("convert")
 
-        tk.Label(self.root, text="Convert Currency", font=("Helvetica", 18)).pack(pady=20)
+    def build_convert_currency_menu(self, frame):
+        tk.Label(frame, text="Convert Currency", font=("Helvetica", 18)).pack(pady=20)
 
         # Conversion from Coins to Snow
-        tk.Button(self.root, text="Convert 250 Coins to 1 Snow",
+        tk.Button(frame, text=f"Convert {COINS_PER_SNOW} Coins to 1 Snow",
                   width=30, command=self.convert_coins_to_snow).pack(pady=5)
 
         # Conversion from Snow to Coins
-        tk.Button(self.root, text="Convert 1 Snow to 250 Coins",
+        tk.Button(frame, text=f"Convert 1 Snow to {COINS_PER_SNOW} Coins",
                   width=30, command=self.convert_snow_to_coins).pack(pady=5)
 
-        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
+        tk.Button(frame, text="Back", width=20, command=self.main_menu).pack(pady=20)
 
     def convert_coins_to_snow(self):
         """Converts 250 Coins to 1 Snow."""
-        if self.player_currency >= 250:
-            self.player_currency -= 250
-            self.player_snow += 1
-            self.net_worth += 250  # Add to net worth
-            self.add_experience(5)  # Award XP for currency conversion
-            self.update_currency_display()
-            messagebox.showinfo("Conversion Successful", "Converted 250 Coins to 1 Snow!")
-        else:
-            messagebox.showerror("Error", "Not enough coins to convert!")
-        self.convert_currency_menu()
+        try:
+            self.game.convert_coins_to_snow()
+        except GameError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.update_currency_display()
+        messagebox.showinfo("Conversion Successful", f"Converted {COINS_PER_SNOW} Coins to 1 Snow!")
 
     def convert_snow_to_coins(self):
         """Converts 1 Snow to 250 Coins."""
-        if self.player_snow >= 1:
-            self.player_snow -= 1
-            self.player_currency += 250
-            self.net_worth += 250  # Add to net worth
-            self.add_experience(5)  # Award XP for currency conversion
-            self.update_currency_display()
-            messagebox.showinfo("Conversion Successful", "Converted 1 Snow to 250 Coins!")
-        else:
-            messagebox.showerror("Error", "Not enough Snow to convert!")
-        self.convert_currency_menu()
+        try:
+            self.game.convert_snow_to_coins()
+        except GameError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.update_currency_display()
+        messagebox.showinfo("Conversion Successful", f"Converted 1 Snow to {COINS_PER_SNOW} Coins!")
 
     def shop_menu(self):
         """Display the shop menu where players can buy packs."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.screens.show("shop")
 
+    def build_shop_menu(self, frame):
         # Create a canvas and a frame that will hold all the pack buttons
-        canvas = tk.Canvas(self.root)
-        scroll_y = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scroll_y.pack(anchor="center")
+        canvas = tk.Canvas(frame)
+        scroll_y = tk.Scrollbar(frame, orient="vertical", command=canvas.yview)
 
         # This frame will be where the actual widgets (buttons, labels) are placed
         scrollable_frame = tk.Frame(canvas)
@@ -264,12 +375,13 @@ class CardGameApp:
         def on_frame_configure(event):
             canvas.configure(scrollregion=canvas.bbox("all"))
 
-        # Add a binding to the mouse scroll wheel
+        # Scroll with the mouse wheel while the pointer is over the shop
         def _on_mouse_wheel(event):
             canvas.yview_scroll(-1 * int((event.delta / 120)), "units")
 
         scrollable_frame.bind("<Configure>", on_frame_configure)
-        canvas.bind_all("<MouseWheel>", _on_mouse_wheel)
+        canvas.bind("<Enter>", lambda event: canvas.bind_all("<MouseWheel>", _on_mouse_wheel))
+        canvas.bind("<Leave>", lambda event: canvas.unbind_all("<MouseWheel>"))
 
         # Create a window inside the canvas to hold the scrollable frame
         new_window_with = 800
@@ -293,356 +405,303 @@ class CardGameApp:
             if not pack_info.get("purchasable", True):
                 continue  # Skip Easter Egg packs (not purchasable)
 
-            icon = self.icons.get(pack_name)
+            icon = self.assets.icon(pack_name)
 
-            frame = tk.Frame(pack_frame)
-            frame.pack(pady=5)
+            row = tk.Frame(pack_frame)
+            row.pack(pady=5)
 
             # Determine the currency to display
             currency_type = "Coins" if pack_info["currency"] == "coins" else "Snow"
             cost_text = f"{pack_info['cost']} {currency_type}"
 
-            tk.Label(frame, image=icon).pack(side='left', padx=10)
-            tk.Button(frame, text=f"{pack_name} - {cost_text}",
+            tk.Label(row, image=icon).pack(side='left', padx=10)
+            tk.Button(row, text=f"{pack_name} - {cost_text}",
                     width=30,
                     command=lambda name=pack_name: self.select_pack_quantity(name)).pack(side='left')
 
         # Position the back button at the bottom of the scrollable_frame, centered
         tk.Button(scrollable_frame, text="Back", width=20, command=self.main_menu).pack(pady=20)
 
-        # Pack everything in the main root window
+        # Pack everything in the screen frame
         canvas.pack(side="left", fill="both", expand=True)
         scroll_y.pack(side="right", fill="y")
 
-        # Ensure currency display is updated after everything is set up
-        self.update_currency_display()
-
     def select_pack_quantity(self, pack_name):
         """Display a menu to select the quantity of packs to buy."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.update_currency_display()
-
-        tk.Label(self.root, text=f"Buy {pack_name}", font=("Helvetica", 18)).pack(pady=20)
-
-        def purchase(quantity):
-            self.buy_pack(pack_name, quantity)
-
+        self.screens.frame("pack_quantity")
+        self.selected_pack = pack_name
+        self.pack_quantity_title_var.set(f"Buy {pack_name}")
+        for quantity, text_var in enumerate(self.pack_quantity_vars, start=1):
+            text_var.set(f"Buy {quantity} {pack_name}(s)")
+        self.screens.show("pack_quantity")
+
+    def build_pack_quantity_menu(self, frame):
+        self.selected_pack = None
+        self.pack_quantity_title_var = tk.StringVar()
+        tk.Label(frame, textvariable=self.pack_quantity_title_var, font=("Helvetica", 18)).pack(pady=20)
+
+        self.pack_quantity_vars = []
         for i in range(1, 6):  # Allows selection of 1 to 5 packs
-            tk.Button(self.root, text=f"Buy {i} {pack_name}(s)",
+            text_var = tk.StringVar()
+            self.pack_quantity_vars.append(text_var)
+            tk.Button(frame, textvariable=text_var,
                       width=30,
-                      command=lambda quantity=i: purchase(quantity)).pack(pady=5)
+                      command=lambda quantity=i: self.buy_pack(self.selected_pack, quantity)).pack(pady=5)
 
-        tk.Button(self.root, text="Back", width=20, command=self.shop_menu).pack(pady=20)
+        tk.Button(frame, text="Back", width=20, command=self.shop_menu).pack(pady=20)
 
     def buy_pack(self, pack_name, quantity=1):
-        pack_info = CARD_PACKS[pack_name]
-        total_cost = pack_info["cost"] * quantity
-
-        if pack_info["currency"] == "coins":
-            if self.player_currency >= total_cost:
-                self.player_currency -= total_cost
-                self.net_worth += total_cost  # Track spending for net worth
-                self.add_experience(10 * quantity)  # Award XP for buying packs
-                self.player_inventory.extend([pack_name] * quantity)
-                messagebox.showinfo("Pack Purchased", f"You bought {quantity} {pack_name}(s)!")
-                self.total_packs_opened += quantity  # Increment total packs opened
-                self.inventory_menu()  # Go to inventory to reflect the purchase
-            else:
-                messagebox.showerror("Error", "Not enough currency!")
-                self.shop_menu()
-        elif pack_info["currency"] == "snow":
-            if self.player_snow >= total_cost:
-                self.player_snow -= total_cost
-                self.net_worth += total_cost * 250  # Track spending for net worth
-                self.add_experience(10 * quantity)  # Award XP for buying packs
-                self.player_inventory.extend([pack_name] * quantity)
-                messagebox.showinfo("Pack Purchased", f"You bought {quantity} {pack_name}(s)!")
-                self.total_packs_opened += quantity  # Increment total packs opened
-                self.inventory_menu()  # Go to inventory to reflect the purchase
-            else:
-                messagebox.showerror("Error", "Not enough Snow!")
-                self.shop_menu()
+        try:
+            self.game.buy_pack(pack_name, quantity)
+        except GameError as e:
+            messagebox.showerror("Error", str(e))
+            self.shop_menu()
+            return
+        self.update_currency_display()
+        messagebox.showinfo("Pack Purchased", f"You bought {quantity} {pack_name}(s)!")
+        self.inventory_menu()  # Go to inventory to reflect the purchase
 
     def inventory_menu(self):
         """Displays the inventory menu."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.screens.show("inventory")
 
-        self.update_currency_display()
+    def build_inventory_menu(self, frame):
+        tk.Label(frame, text="Inventory", font=("Helvetica", 18)).pack(pady=20)
 
-        tk.Label(self.root, text="Inventory", font=("Helvetica", 18)).pack(pady=20)
-
-        tk.Button(self.root, text="Open Packs", width=20, command=self.open_pack_inventory).pack(pady=10)
-        tk.Button(self.root, text="View Cards", width=20, command=self.card_inventory_menu).pack(pady=10)
-        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
+        tk.Button(frame, text="Open Packs", width=20, command=self.open_pack_inventory).pack(pady=10)
+        tk.Button(frame, text="View Cards", width=20, command=self.card_inventory_menu).pack(pady=10)
+        tk.Button(frame, text="Back", width=20, command=self.main_menu).pack(pady=20)
 
     def open_pack_inventory(self):
-        """Displays the list of packs available to open."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.update_currency_display()
-
-        tk.Label(self.root, text="Your Packs", font=("Helvetica", 18)).pack(pady=20)
-
-        if self.player_inventory:
-            for i, pack in enumerate(self.player_inventory):
-                icon = self.icons.get(pack)
-                frame = tk.Frame(self.root)
-                frame.pack(pady=5)
-
-                tk.Label(frame, image=icon).pack(side='left', padx=10)
-                tk.Button(frame, text=f"Open {pack}",
-                          width=30,
-                          command=lambda idx=i: self.open_pack_animation(idx)).pack(side='left')
-        else:
-            tk.Label(self.root, text="No Packs in Inventory").pack(pady=10)
-
-        tk.Button(self.root, text="Back", width=20, command=self.inventory_menu).pack(pady=20)
-
-    def open_pack_animation(self, index):
-        """Animates the card pack opening with the correct animation based on the pack."""
-        pack_name = self.player_inventory.pop(index)  # Remove the pack from inventory
-        result = self.generate_card(pack_name)        # Generate the card based on the pack
-        self.total_packs_opened += 1  # Increment total packs opened
-        self.add_experience(20)  # Award XP for opening packs
-
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
-        self.update_currency_display()
-
-        # Get the correct animation image for the pack
-        pack_animation_image = self.pack_animation_images.get(pack_name, None)
-        
-        if pack_animation_image:
-            pack_img = tk.Label(self.root, image=pack_animation_image)
-            pack_img.pack(pady=20)
-            self.root.after(2000, lambda: self.reveal_card(result))
-        else:
-            self.reveal_card(result)
+        """Displays the packs available to open, one row per pack type."""
+        self.screens.show("packs")
+
+    def build_pack_inventory(self, frame):
+        tk.Label(frame, text="Your Packs", font=("Helvetica", 18)).pack(pady=20)
+        tk.Button(frame, text="Back", width=20, command=self.inventory_menu).pack(side="bottom", pady=20)
+        self.pack_groups = []
+
+        def make_row(parent):
+            row = tk.Frame(parent)
+            row.icon = tk.Label(row)
+            row.icon.pack(side='left', padx=10)
+            row.button = tk.Button(row, width=30)
+            row.button.pack(side='left')
+            row.pack_name = None
+            row.quantity_var = tk.StringVar()
+            row.quantity = tk.Spinbox(row, from_=1, to=1, width=5, textvariable=row.quantity_var)
+            row.quantity.pack(side='left', padx=5)
+            row.open_some = tk.Button(row, text="Open", width=6)
+            row.open_some.pack(side='left', padx=5)
+            row.open_all = tk.Button(row, text="Open All", width=10)
+            row.open_all.pack(side='left')
+            return row
+
+        def fill_row(row, index):
+            pack, count = self.pack_groups[index]
+            row.icon.configure(image=self.assets.icon(pack) or "")
+            row.button.configure(text=f"Open {pack} (x{count})",
+                                 command=lambda name=pack: self.open_pack_of_type(name))
+            # Rows are reused while scrolling, so only reset the quantity when the row shows another pack
+            row.quantity.configure(to=count)
+            if row.pack_name != pack:
+                row.pack_name = pack
+                row.quantity_var.set(str(min(count, OPEN_SOME_QUANTITY)))
+            row.open_some.configure(command=lambda name=pack, var=row.quantity_var: self.open_some_packs(name, var.get()))
+            row.open_all.configure(command=lambda name=pack: self.open_packs_of_type(name))
+
+        self.pack_list = VirtualList(frame, make_row, fill_row, row_height=60)
+        self.pack_list_empty = tk.Label(frame, text="No Packs in Inventory")
+
+    def refresh_pack_inventory(self):
+        self.pack_groups = self.player_inventory.groups()
+        self.show_list(self.pack_list, self.pack_list_empty, len(self.pack_groups))
 
     def card_inventory_menu(self):
-        """Displays the player's card collection."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        """Displays the player's card collection, one row per card type."""
+        self.screens.show("cards")
 
-        self.update_currency_display()
+    def build_card_inventory(self, frame):
+        tk.Label(frame, text="Your Cards", font=("Helvetica", 18)).pack(pady=20)
+        tk.Button(frame, text="Back", width=20, command=self.inventory_menu).pack(side="bottom", pady=20)
+        self.card_groups = []
 
-        tk.Label(self.root, text="Your Cards", font=("Helvetica", 18)).pack(pady=20)
+        def make_row(parent):
+            return tk.Label(parent, font=("Helvetica", 14))
 
-        if self.player_cards:
-            for card in self.player_cards:
-                tk.Label(self.root, text=card, font=("Helvetica", 14)).pack(pady=2)
-        else:
-            tk.Label(self.root, text="No Cards in Inventory").pack(pady=10)
+        def fill_row(row, index):
+            code, count = self.card_groups[index]
+            row.configure(text=f"{card_name(code)} x{count}")
 
-        tk.Button(self.root, text="Back", width=20, command=self.inventory_menu).pack(pady=20)
+        self.card_list = VirtualList(frame, make_row, fill_row, row_height=30)
+        self.card_list_empty = tk.Label(frame, text="No Cards in Inventory")
 
-    def market_menu(self):
-        """Displays the market where players can sell their cards."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def refresh_card_inventory(self):
+        self.card_groups = self.player_cards.groups()
+        self.show_list(self.card_list, self.card_list_empty, len(self.card_groups))
 
+    def market_menu(self):
+        """Displays the market where players can sell their cards, one row per card type."""
+        self.screens.show("market")
+
+    def build_market_menu(self, frame):
+        tk.Label(frame, text="Market", font=("Helvetica", 18)).pack(pady=20)
+        tk.Button(frame, text="Back", width=20, command=self.main_menu).pack(side="bottom", pady=20)
+        self.market_groups = []
+
+        # Sell every card whose name contains the filter text, e.g. "shiny" or "cold rare"
+        sell_bar = tk.Frame(frame)
+        sell_bar.pack(pady=5)
+        self.market_filter_var = tk.StringVar()
+        tk.Entry(sell_bar, textvariable=self.market_filter_var, width=25).pack(side="left", padx=5)
+        tk.Button(sell_bar, text="Sell All Matching", width=20, command=self.sell_all_matching).pack(side="left")
+
+        def make_row(parent):
+            return tk.Button(parent, width=40)
+
+        def fill_row(row, index):
+            code, count = self.market_groups[index]
+            row.configure(text=f"Sell {card_name(code)} (x{count}) for {self.get_card_price(code)} Coins",
+                          command=lambda code=code: self.sell_card(code))
+
+        self.market_list = VirtualList(frame, make_row, fill_row, row_height=40)
+        self.market_list_empty = tk.Label(frame, text="No Cards to Sell", font=("Helvetica", 14))
+
+    def refresh_market_menu(self):
+        self.market_groups = self.player_cards.groups()
+        self.show_list(self.market_list, self.market_list_empty, len(self.market_groups))
+
+    def sell_card(self, code):
+        """Handles selling one card of a type from the inventory."""
+        try:
+            price = self.game.sell_card(code)
+        except GameError as e:
+            messagebox.showerror("Error", str(e))
+            return
         self.update_currency_display()
-
-        tk.Label(self.root, text="Market", font=("Helvetica", 18)).pack(pady=20)
-
-        if self.player_cards:
-            for i, card in enumerate(self.player_cards):
-                try:
-                    price = self.get_card_price(card)
-                    tk.Button(self.root, text=f"Sell {card} for {price} Coins",
-                            width=40,
-                            command=lambda idx=i, price=price: self.sell_card(idx, price)).pack(pady=5)
-                except Exception as e:
-                    # Print the exception in the console for debugging
-                    print(f"Error displaying card {card}: {e}")
-                    # Show an error messagebox for feedback
-                    messagebox.showerror("Error", f"Could not display card: {card}")
-        else:
-            tk.Label(self.root, text="No Cards to Sell", font=("Helvetica", 14)).pack(pady=10)
-
-        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
-
-    def sell_card(self, index, price):
-        """Handles selling a card from the inventory."""
-        card = self.player_cards.pop(index)
-        self.player_currency += price
-        self.net_worth += price  # Add to net worth
-        self.total_cards_sold += 1  # Increment total cards sold
-        self.add_experience(15)  # Award XP for selling cards
-        messagebox.showinfo("Card Sold", f"You sold {card} for {price} coins!")
-        self.market_menu()
+        messagebox.showinfo("Card Sold", f"You sold {card_name(code)} for {price} coins!")
+        if self.screens.current == "market":
+            self.refresh_market_menu()  # Update the rows in place
+
+    def sell_all_matching(self):
+        """Sells every card whose name contains the market filter text, after asking first."""
+        text = self.market_filter_var.get()
+        codes = self.game.matching_cards(text)
+        if not codes:
+            messagebox.showerror("Error", f"No cards match \"{text}\".")
+            return
+        count = sum(self.player_cards.counts[code] for code in codes)
+        value = sum(self.get_card_price(code) * self.player_cards.counts[code] for code in codes)
+        if not messagebox.askyesno("Sell All", f"Sell {count} card(s) for {value} coins?"):
+            return
+
+        sold, coins = self.game.sell_all(codes)
+        self.update_currency_display()
+        messagebox.showinfo("Cards Sold", f"You sold {sold} card(s) for {coins} coins!")
+        self.refresh_market_menu()
 
     def get_card_price(self, card):
         """Determines the selling price of a card based on its rarity and variant."""
-        base_prices = {
-            "common": 110,
-            "uncommon": 175,
-            "rare": 250,
-            "super rare": 500,
-            "epic": 1000,
-            "mythic": 1600,
-            "legendary": 3200,
-            "godlike": 6400,
-            "star": 30000,
-            "cold common": 220,
-            "cold uncommon": 350,
-            "cold rare": 500,
-            "cold super rare": 800,
-            "cold epic": 1600,
-            "cold mythic": 3200,
-            "cold legendary": 6400,
-        }
-
-        # Debugging output to see the exact card name
-        print(f"Processing card: {card}")
-
-        card_lower = card.lower().strip()
-        price = 0
-
-        # Match rarity, handling potential errors or unusual formats
-        matched = False
-
-        # Check for more specific rarities first
-        rarity_order = sorted(base_prices.keys(), key=lambda r: len(r), reverse=True)
-
-        for rarity in rarity_order:
-            base_price = base_prices[rarity]
-            # Debugging output for matching attempt
-            print(f"Trying to match rarity '{rarity}' with card '{card_lower}'")
-            
-            if re.search(r'\b' + re.escape(rarity) + r'\b', card_lower):
-                price = base_price
-                matched = True
-                print(f"Match found: {rarity}, base price: {base_price}")
-                break
-
-        if not matched:
-            # If no rarity is matched, output an error with more details
-            error_message = f"Could not determine the rarity for card: '{card}' (processed as '{card_lower}')"
-            print(error_message)
-            messagebox.showerror("Error", error_message)
-            return 0
-
-        # Adjust the price based on card variants
-        if "shiny" in card_lower:
-            print(f"Card '{card_lower}' is shiny. Doubling price.")
-            price *= 2
-        elif "shadow" in card_lower:
-            print(f"Card '{card_lower}' is shadow. Tripling price.")
-            price *= 3
-        elif "cold" in card_lower and "cold" not in rarity:
-            print(f"Card '{card_lower}' has cold variant. Doubling price.")
-            price *= 2
-
-        # Final debugging output for the determined price
-        print(f"Final price for '{card}': {price}")
-        return price
-
+        return card_price(card)
 
     def open_pack_animation(self, index):
-        """Animates the card pack opening with the correct animation based on the pack."""
-        pack_name = self.player_inventory.pop(index)  # Remove the pack from inventory
-        result = self.generate_card(pack_name)        # Generate the card based on the pack
-
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        """Opens the pack at a position in the inventory list."""
+        self.open_pack_of_type(self.player_inventory[index])
 
+    def open_pack_of_type(self, pack_name):
+        """Animates the card pack opening with the correct animation based on the pack."""
+        try:
+            result = self.game.open_pack(pack_name).message
+        except GameError as e:
+            messagebox.showerror("Error", str(e))
+            return
         self.update_currency_display()
 
         # Get the correct animation image for the pack
-        pack_animation_image = self.pack_animation_images.get(pack_name, None)
-        
+        pack_animation_image = self.assets.animation(pack_name)
+
         if pack_animation_image:
-            pack_img = tk.Label(self.root, image=pack_animation_image)
-            pack_img.pack(pady=20)
+            self.screens.frame("opening")
+            self.opening_image_label.configure(image=pack_animation_image)
+            self.screens.show("opening")
             self.root.after(2000, lambda: self.reveal_card(result))
         else:
             self.reveal_card(result)
 
-    def reveal_card(self, card_obtained):
-        """Displays the obtained card after opening a pack."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
+    def open_some_packs(self, pack_name, quantity_text):
+        """Opens the number of packs entered in a pack row's quantity box."""
+        held = self.player_inventory.count(pack_name)
+        try:
+            quantity = int(quantity_text)
+        except ValueError:
+            quantity = 0
+        if not 1 <= quantity <= held:
+            messagebox.showerror("Error", f"Enter a number of {pack_name}s from 1 to {held}.")
+            return
+        self.open_packs_of_type(pack_name, quantity)
+
+    def open_packs_of_type(self, pack_name, quantity=None):
+        """Opens several packs of one type at once (all of them if quantity is None) and shows a summary."""
+        try:
+            summary = self.game.open_packs(pack_name, quantity)
+        except GameError as e:
+            messagebox.showerror("Error", str(e))
+            return
         self.update_currency_display()
 
-        tk.Label(self.root, text="You obtained:", font=("Helvetica", 18)).pack(pady=20)
-        tk.Label(self.root, text=card_obtained, font=("Helvetica", 16)).pack(pady=10)
-
-        tk.Button(self.root, text="Back to Inventory", width=20, command=self.inventory_menu).pack(pady=20)
-
-    def generate_card(self, pack_name):
-        """Generates a card from a given pack based on its rarity distribution or provides a refund."""
-        if random.random() <= REFUND_CHANCE:
-            refund_amount = CARD_PACKS[pack_name]["cost"] * 2
-            self.player_currency += refund_amount
-            self.net_worth += refund_amount  # Add to net worth
-            self.add_experience(5)  # Award XP for getting a refund
-            return f"Refund! You received {refund_amount} Coins."
-
-        # Easter Egg logic: 0.5% chance to trigger an Easter Egg
-        if random.random() <= EASTER_EGG_CHANCE:
-            easter_egg_choice = random.choices(
-                list(EASTER_EGG_OPTIONS.keys()), 
-                list(EASTER_EGG_OPTIONS.values()), 
-                k=1
-            )[0]
-            
-            if easter_egg_choice == "Million Coins":
-                self.player_currency += 1_000_000
-                self.net_worth += 1_000_000  # Add to net worth
-                self.easter_eggs_found += 1  # Increment Easter eggs found
-                self.add_experience(1000)  # Big XP reward for Easter egg
-                return "Easter Egg! You received 1 Million Coins!"
-            else:
-                self.player_inventory.append(easter_egg_choice)
-                self.easter_eggs_found += 1  # Increment Easter eggs found
-                self.add_experience(100)  # XP reward for Easter egg
-                return f"Easter Egg! You found a hidden {easter_egg_choice}!"
-
-        # Normal card generation logic based on pack's rarity distribution
-        pack_info = CARD_PACKS[pack_name]
-        rarity_distribution = pack_info["rarity_distribution"]
-
-        rarities = list(rarity_distribution.keys())
-        probabilities = list(rarity_distribution.values())
-
-        selected_rarity = random.choices(rarities, probabilities, k=1)[0]
-
-        # Determine if the card is a variant (Shiny, Shadow, Cold)
-        card_variant = ""
-        variant_roll = random.random()
+        self.screens.frame("summary")
+        self.summary_text.configure(state="normal")
+        self.summary_text.delete("1.0", tk.END)
+        self.summary_text.insert(tk.END, "\n".join(summary.lines()))
+        self.summary_text.configure(state="disabled")
+        self.screens.show("summary")
+
+    def build_summary_screen(self, frame):
+        tk.Label(frame, text="You obtained:", font=("Helvetica", 18)).pack(pady=20)
+        tk.Button(frame, text="Back to Inventory", width=20, command=self.open_pack_inventory).pack(side="bottom", pady=20)
+
+        body = Frame(frame)
+        body.pack(fill="both", expand=True, padx=20)
+        scroll_y = Scrollbar(body, orient="vertical")
+        self.summary_text = tk.Text(body, font=("Helvetica", 14), width=50, yscrollcommand=scroll_y.set)
+        scroll_y.configure(command=self.summary_text.yview)
+        scroll_y.pack(side="right", fill="y")
+        self.summary_text.pack(side="left", fill="both", expand=True)
 
-        if "cold" not in selected_rarity.lower():  # Cold cards from normal packs
-            if variant_roll <= SHADOW_CHANCE:
-                card_variant = "Shadow "
-            elif variant_roll <= SHINY_CHANCE + SHADOW_CHANCE:
-                card_variant = "Shiny "
-            elif variant_roll <= COLD_CHANCE + SHINY_CHANCE + SHADOW_CHANCE:
-                card_variant = "Cold "
+    def build_opening_screen(self, frame):
+        self.opening_image_label = tk.Label(frame)
+        self.opening_image_label.pack(pady=20)
 
-        # Cold packs always give a cold variant
-        if "cold" in selected_rarity.lower():
-            card_variant = ""  # Avoid adding "Cold" again
+    def reveal_card(self, card_obtained):
+        """Displays the obtained card after opening a pack."""
+        self.screens.frame("reveal")
+        self.revealed_card_var.set(card_obtained)
+        self.screens.show("reveal")
 
-        card_name = f"{card_variant}{selected_rarity.capitalize()} Card"
+    def build_reveal_screen(self, frame):
+        self.revealed_card_var = tk.StringVar()
+        tk.Label(frame, text="You obtained:", font=("Helvetica", 18)).pack(pady=20)
+        tk.Label(frame, textvariable=self.revealed_card_var, font=("Helvetica", 16)).pack(pady=10)
 
-        self.player_cards.append(card_name)
-        return card_name
+        tk.Button(frame, text="Back to Inventory", width=20, command=self.inventory_menu).pack(pady=20)
 
     def save_progress(self):
-        """Saves the current game progress."""
-        data = (self.player_currency, self.player_snow, self.player_inventory, self.player_cards,
-                self.net_worth, self.total_packs_opened, self.total_cards_sold, 
-                self.easter_eggs_found, self.experience_points)
-        save_game(data)
+        """Saves the current game progress as a snapshot and starts a fresh journal."""
+        future = self.autosave.save(snapshot=True)
+
+        # The snapshot is written on the autosave thread; report once it is on disk
+        def check():
+            if not future.done():
+                self.root.after(POLL_MS, check)
+            elif future.exception() is not None:
+                messagebox.showerror("Save Game", f"Could not save the game: {future.exception()}")
+            else:
+                messagebox.showinfo("Save Game", "Game progress saved successfully!")
+
+        check()
 
 if __name__ == "__main__":
+    configure_logging()
     root = tk.Tk()
     root.geometry("600x600")  # Set the window size
     app = CardGameApp(root)
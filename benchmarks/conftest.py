@@ -0,0 +1,63 @@
+"""Shared fixtures for the benchmarks: card collections of every size and a hidden Tk root.
+
+Run from the repository root with `python -m pytest benchmarks`; see the
+README for storing a baseline and failing on regressions.
+"""
+import random
+from array import array
+from functools import lru_cache
+
+import pytest
+
+from packsim.cards import CARD_CODE_COUNT, CardCollection
+from packsim.game import GameState
+from packsim.rng import RngService
+
+# Collection sizes every size-dependent benchmark runs at
+SIZES = (10, 1_000, 100_000, 1_000_000)
+
+SEED = 2024
+
+
+@lru_cache(maxsize=None)
+def _base_cards(size):
+    # Built once per size; benchmarks get a copy so they can change it freely
+    rng = random.Random(size)
+    cards = CardCollection()
+    for code in rng.choices(range(CARD_CODE_COUNT), k=size):
+        cards.add(code)
+    return cards
+
+
+def make_cards(size):
+    """Return a CardCollection of size cards spread at random over every card code."""
+    return CardCollection.from_counts(array(CardCollection.TYPECODE, _base_cards(size).counts))
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size}cards")
+def size(request):
+    return request.param
+
+
+@pytest.fixture
+def cards(size):
+    return make_cards(size)
+
+
+@pytest.fixture
+def game(cards):
+    """A seeded game holding the parametrized collection and plenty of coins."""
+    return GameState(coins=10**12, cards=cards, rng=RngService(SEED))
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    """A withdrawn Tk root; screen benchmarks are skipped without a display (use xvfb-run)."""
+    tk = pytest.importorskip("tkinter")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk needs a display, e.g. xvfb-run python -m pytest benchmarks ({e})")
+    root.withdraw()
+    yield root
+    root.destroy()
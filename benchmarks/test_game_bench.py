@@ -0,0 +1,52 @@
+"""Pack opening throughput: one card at a time, a batch of packs, and the NumPy simulator path."""
+import pytest
+
+from packsim.game import GameState
+from packsim.rng import RngService
+
+from conftest import SEED, make_cards
+
+PACK = "Ruby Pack"
+BATCH = 1_000
+# Below BATCH_OPEN_MIN open_packs rolls pack by pack, above it with packsim.batch
+OPEN_QUANTITIES = [16, BATCH, 100_000]
+
+
+@pytest.mark.benchmark(group="open")
+def test_generate_card(benchmark, game):
+    benchmark(game.generate_card, PACK)
+
+
+@pytest.mark.benchmark(group="open")
+def test_open_pack(benchmark, game):
+    def buy_and_open():
+        game.buy_pack(PACK)
+        return game.open_pack(PACK)
+
+    benchmark(buy_and_open)
+
+
+@pytest.mark.benchmark(group="open-batch")
+@pytest.mark.parametrize("quantity", OPEN_QUANTITIES)
+def test_open_packs(benchmark, game, quantity):
+    def buy_and_open():
+        game.buy_pack(PACK, quantity)
+        return game.open_packs(PACK)
+
+    benchmark(buy_and_open)
+
+
+@pytest.mark.benchmark(group="open-batch")
+def test_batch_open_packs(benchmark):
+    batch = pytest.importorskip("packsim.batch")
+    rng = RngService(SEED)
+    benchmark(batch.open_packs, PACK, BATCH, rng)
+
+
+@pytest.mark.benchmark(group="sell")
+def test_sell_all(benchmark, size):
+    def setup():
+        game = GameState(cards=make_cards(size), rng=RngService(SEED))
+        return (game.matching_cards("shiny"),), {"game": game}
+
+    benchmark.pedantic(lambda codes, game: game.sell_all(codes), setup=setup, rounds=20)
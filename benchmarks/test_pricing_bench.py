@@ -0,0 +1,41 @@
+"""Pricing throughput and the cost of keeping net worth up to date."""
+import pytest
+
+from packsim.cards import CARD_CODE_COUNT
+from packsim.ledger import Ledger
+from packsim.pricing import card_price, price_many, total_price
+
+
+@pytest.mark.benchmark(group="price")
+def test_card_price(benchmark):
+    def price_every_code():
+        for code in range(CARD_CODE_COUNT):
+            card_price(code)
+
+    benchmark(price_every_code)
+
+
+@pytest.mark.benchmark(group="price-collection")
+def test_total_price(benchmark, cards):
+    benchmark(total_price, cards)
+
+
+@pytest.mark.benchmark(group="price-collection")
+def test_price_many(benchmark, cards):
+    benchmark(price_many, cards)
+
+
+@pytest.mark.benchmark(group="net-worth")
+def test_net_worth_after_add(benchmark, game):
+    # The ledger keeps card value as a running total, so this should not depend on the size
+    def add_and_value():
+        game.ledger.add_card(0)
+        return game.net_worth
+
+    benchmark(add_and_value)
+
+
+@pytest.mark.benchmark(group="net-worth")
+def test_ledger_recount(benchmark, cards):
+    ledger = Ledger()
+    benchmark(ledger.set_cards, cards)
@@ -0,0 +1,30 @@
+"""Save and load latency for the binary and columnar formats."""
+import pytest
+
+from packsim.game import GameState
+from packsim.saves import COLUMNAR_SUFFIX, read_save, write_save
+
+FORMATS = {".sav": "binary", COLUMNAR_SUFFIX: "columnar"}
+
+
+@pytest.fixture(params=list(FORMATS), ids=FORMATS.get)
+def save_path(request, tmp_path):
+    return str(tmp_path / f"savegame{request.param}")
+
+
+@pytest.mark.benchmark(group="save")
+def test_write_save(benchmark, game, save_path):
+    data = game.to_save()
+    benchmark(write_save, data, save_path)
+
+
+@pytest.mark.benchmark(group="load")
+def test_read_save(benchmark, game, save_path):
+    write_save(game.to_save(), save_path)
+
+    def load():
+        loaded = GameState.from_save(read_save(save_path))
+        loaded.cards.detach()  # Releases a columnar save's mapping, as the game does before saving again
+        return loaded
+
+    benchmark(load)
@@ -0,0 +1,60 @@
+"""Screen build and refresh time for the market, whose rows depend on the collection."""
+import pytest
+
+
+class _IdleTask:
+    """Stands in for the save loader, which would read and repair the real save files."""
+
+    def __init__(self, func, name="background"):
+        pass
+
+    def start(self):
+        return self
+
+
+@pytest.fixture
+def app(monkeypatch, tk_root, game):
+    """A CardGameApp on the hidden root, holding the parametrized game.
+
+    Neither the save loader nor the image loading after the first frame is
+    started, so the benchmarks never touch the save or journal files.
+    """
+    import PackOpeningSimulatorFixed as main
+
+    monkeypatch.setattr(main, "BackgroundTask", _IdleTask)
+    monkeypatch.setattr(main, "after_first_paint", lambda root, callback: None)
+    app = main.CardGameApp(tk_root)
+    app.game = game
+    yield app
+    app.screens.container.destroy()
+
+
+@pytest.mark.benchmark(group="screen-build")
+def test_build_market_menu(benchmark, app):
+    import tkinter as tk
+
+    def build():
+        frame = tk.Frame(app.screens.container)
+        app.build_market_menu(frame)
+        app.refresh_market_menu()
+        frame.update_idletasks()
+        frame.destroy()
+
+    benchmark(build)
+
+
+@pytest.mark.benchmark(group="screen-refresh")
+def test_refresh_market_menu(benchmark, app):
+    app.screens.show("market")
+
+    def refresh():
+        app.refresh_market_menu()
+        app.root.update_idletasks()
+
+    benchmark(refresh)
+
+
+@pytest.mark.benchmark(group="screen-refresh")
+def test_refresh_stats_menu(benchmark, app):
+    app.screens.show("stats")
+    benchmark(app.refresh_stats_menu)
@@ -0,0 +1 @@
+"""Game rules and tooling for the Pack Opening Simulator."""
@@ -0,0 +1,110 @@
+"""Pack images: resized in a thread pool, cached on disk, turned into PhotoImages on demand."""
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageTk
+
+ICON_SIZE = (50, 50)
+ANIMATION_SIZE = (200, 200)
+CACHE_DIR = ".asset_cache"
+
+
+def animation_path(pack_name):
+    """Path of the image shown while a pack is being opened."""
+    return f"assets/packs/images/{pack_name.lower().replace(' ', '_')}_animation.png"
+
+
+def load_thumbnail(path, size, cache_dir=CACHE_DIR):
+    """Return path resized to size, reusing a cached copy when the source is unchanged.
+
+    The cache key covers the source path, its mtime and byte size, and the
+    target size, so editing an image or asking for a new size misses the cache.
+    """
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{size[0]}x{size[1]}"
+    cached = os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+    try:
+        image = Image.open(cached)
+        image.load()
+        return image
+    except OSError:
+        pass
+
+    with Image.open(path) as source:
+        image = source.resize(size, Image.LANCZOS)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_cached = f"{cached}.{os.getpid()}.tmp"
+        image.save(tmp_cached, "PNG")
+        os.replace(tmp_cached, cached)
+    except OSError:
+        pass  # A read-only cache only costs the resampling next time
+    return image
+
+
+class AssetManager:
+    """Loads pack icons and animation images off the Tk thread.
+
+    preload_icons() queues every icon on a thread pool; icon() and animation()
+    hand back PhotoImages, waiting for a queued job or loading on first use.
+    PhotoImages themselves are created on the calling (Tk) thread.
+    """
+
+    def __init__(self, card_packs, cache_dir=CACHE_DIR, max_workers=4, on_missing=None):
+        self.card_packs = card_packs
+        self.cache_dir = cache_dir
+        self.on_missing = on_missing
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets")
+        self._pending = {}
+        self._photos = {}
+
+    def preload_icons(self):
+        """Start decoding and resizing every pack icon in the background."""
+        for pack_name in self.card_packs:
+            self._submit("icon", pack_name)
+
+    def icon(self, pack_name):
+        """The 50x50 shop icon for a pack, or None if the image is missing."""
+        return self._photo("icon", pack_name)
+
+    def animation(self, pack_name):
+        """The 200x200 opening image for a pack, loaded the first time it is needed."""
+        return self._photo("animation", pack_name)
+
+    def _source(self, kind, pack_name):
+        if kind == "icon":
+            return self.card_packs[pack_name]["icon_path"], ICON_SIZE
+        return animation_path(pack_name), ANIMATION_SIZE
+
+    def _submit(self, kind, pack_name):
+        key = (kind, pack_name)
+        future = self._pending.get(key)
+        if future is None and key not in self._photos:
+            path, size = self._source(kind, pack_name)
+            future = self._executor.submit(load_thumbnail, path, size, self.cache_dir)
+            self._pending[key] = future
+        return future
+
+    def _photo(self, kind, pack_name):
+        key = (kind, pack_name)
+        if key in self._photos:
+            return self._photos[key]
+
+        future = self._submit(kind, pack_name)
+        del self._pending[key]
+        try:
+            photo = ImageTk.PhotoImage(future.result())
+        except FileNotFoundError:
+            photo = None
+            if self.on_missing is not None:
+                path, _ = self._source(kind, pack_name)
+                if kind == "icon":
+                    self.on_missing(f"Image for {pack_name} not found at {path}")
+                else:
+                    self.on_missing(f"Animation image for {pack_name} not found.")
+        self._photos[key] = photo
+        return photo
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+"""Pack image atlas: every icon and animation image in one PNG plus a JSON index.
+
+Build it once (it needs Pillow) with
+
+    python -m packsim.atlas
+
+The game then reads and decodes a single image at startup and slices each
+PhotoImage out of it with Tk's own PNG support, so Pillow is not needed at
+run time.
+"""
+import json
+import os
+import sys
+import tkinter as tk
+
+from packsim.config import CARD_PACKS
+
+ATLAS_INDEX = "assets/packs/atlas.json"
+ATLAS_MAX_WIDTH = 1024
+
+
+def _shelf_layout(sizes, max_width=ATLAS_MAX_WIDTH):
+    """Place rectangles left to right in rows, tallest first; return positions and atlas size."""
+    positions = {}
+    x = y = shelf_height = width = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: -item[1][1]):
+        if x + w > max_width and x > 0:
+            y += shelf_height
+            x = shelf_height = 0
+        positions[key] = (x, y, w, h)
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+    return positions, (width, y + shelf_height)
+
+
+def build_atlas(card_packs=CARD_PACKS, index_path=ATLAS_INDEX):
+    """Resize every pack image, pack them into one PNG and write the index next to it."""
+    from PIL import Image
+
+    from packsim.assets import ANIMATION_SIZE, ICON_SIZE, animation_path, load_thumbnail
+
+    images = {}
+    missing = []
+    for pack_name, pack_info in card_packs.items():
+        for kind, path, size in (("icon", pack_info["icon_path"], ICON_SIZE),
+                                 ("animation", animation_path(pack_name), ANIMATION_SIZE)):
+            try:
+                images[f"{kind}/{pack_name}"] = load_thumbnail(path, size)
+            except FileNotFoundError:
+                missing.append(path)
+
+    positions, atlas_size = _shelf_layout({key: image.size for key, image in images.items()})
+    atlas = Image.new("RGBA", atlas_size)
+    for key, image in images.items():
+        x, y, _, _ = positions[key]
+        atlas.paste(image.convert("RGBA"), (x, y))
+
+    image_name = os.path.splitext(os.path.basename(index_path))[0] + ".png"
+    atlas.save(os.path.join(os.path.dirname(index_path), image_name), optimize=True)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"image": image_name, "sprites": positions}, f)
+    return missing
+
+
+class AtlasAssets:
+    """Serves pack PhotoImages sliced from a prebuilt atlas; same interface as AssetManager."""
+
+    def __init__(self, index_path=ATLAS_INDEX, on_missing=None):
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        self.image_path = os.path.join(os.path.dirname(index_path), index["image"])
+        self.sprites = index["sprites"]
+        self.on_missing = on_missing
+        self._sheet = None
+        self._photos = {}
+
+    def preload_icons(self):
+        """Decode the atlas; individual icons are cut from it when first shown."""
+        self._load_sheet()
+
+    def icon(self, pack_name):
+        return self._photo("icon", pack_name)
+
+    def animation(self, pack_name):
+        return self._photo("animation", pack_name)
+
+    def _load_sheet(self):
+        if self._sheet is None:
+            self._sheet = tk.PhotoImage(file=self.image_path)
+        return self._sheet
+
+    def _photo(self, kind, pack_name):
+        key = f"{kind}/{pack_name}"
+        if key in self._photos:
+            return self._photos[key]
+
+        rect = self.sprites.get(key)
+        if rect is None:
+            photo = None
+            if self.on_missing is not None:
+                self.on_missing(f"No {kind} image for {pack_name} in the image atlas.")
+        else:
+            x, y, w, h = rect
+            photo = tk.PhotoImage(width=w, height=h)
+            photo.tk.call(photo, "copy", self._load_sheet(), "-from", x, y, x + w, y + h, "-to", 0, 0)
+        self._photos[key] = photo
+        return photo
+
+    def shutdown(self):
+        pass
+
+
+if __name__ == "__main__":
+    missing = build_atlas()
+    for path in missing:
+        print(f"Missing image: {path}", file=sys.stderr)
+    print(f"Wrote {ATLAS_INDEX}")
@@ -0,0 +1,123 @@
+"""Saving off the Tk thread: snapshot the state cheaply, write it on a worker.
+
+A GameState keeps its cards and packs as counts, so to_save() copies one
+number per card code and pack type whatever the collection size. That copy
+and the journal's queued lines are taken on the Tk thread; encoding,
+writing and fsyncing happen on a single worker thread, in the order the saves
+were queued, so a snapshot and the journal records after it never overtake
+each other.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from packsim.instrument import METRICS
+from packsim.saves import write_save
+
+# Fold the journal into a fresh snapshot once it holds this many events
+SNAPSHOT_EVERY = 500
+
+log = logging.getLogger(__name__)
+
+
+class AutosaveService:
+    """Writes a game's journal and snapshots on a background thread.
+
+    save() and autosave() are called from the Tk thread and do nothing if
+    nothing changed since the last save; autosave() also skips a tick while
+    the previous save is still being written, leaving its records for the
+    next one. Write times go to the "autosave" timing and last_latency; a
+    failed write is logged, kept in last_error, and makes the next save a
+    full snapshot. Until a snapshot has been written, journal records are not
+    appended, so records queued behind a failed write never leave a gap.
+    """
+
+    def __init__(self, game, filename, snapshot_every=SNAPSHOT_EVERY, metrics=METRICS):
+        self.game = game
+        self.filename = filename
+        self.snapshot_every = snapshot_every
+        self.metrics = metrics
+        self.last_latency = None
+        self.last_error = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self._saved_seq = game.journal.seq
+        self._needs_snapshot = False  # Set by the worker, read and cleared by the Tk thread
+        self._lock = threading.Lock()
+        self._journal_gap = False  # Only used on the worker
+        self._future = None
+
+    @property
+    def busy(self):
+        return self._future is not None and not self._future.done()
+
+    def autosave(self):
+        """The periodic save: like save(), but skipped while the last save is still being written."""
+        if self.busy:
+            return None
+        return self.save()
+
+    def save(self, snapshot=False):
+        """Queue a save of the current state and return its Future, or None if there is nothing to do.
+
+        snapshot=True always writes a full snapshot (for an explicit save);
+        otherwise a snapshot is only written when the journal has grown long.
+        """
+        journal = self.game.journal
+        with self._lock:
+            if not snapshot:
+                if journal.seq == self._saved_seq and not self._needs_snapshot:
+                    return None
+                snapshot = self._needs_snapshot or journal.events_since_snapshot >= self.snapshot_every
+            self._needs_snapshot = False
+
+        if snapshot:
+            data = self.game.to_save()
+            # A mapped columnar save cannot be replaced while the cards still point into it
+            self.game.cards.detach()
+            journal.mark_snapshot()
+            job = partial(self._write_snapshot, data)
+        else:
+            job = partial(journal.append, journal.take())
+        self._saved_seq = journal.seq
+        self._future = self._executor.submit(self._run, "snapshot" if snapshot else "journal", job)
+        return self._future
+
+    def _write_snapshot(self, data):
+        write_save(data, self.filename)
+        self.game.journal.truncate()
+
+    def _run(self, kind, job):
+        if kind == "journal" and self._journal_gap:
+            return  # These records follow lost ones; the snapshot that was asked for will hold them
+        begin = time.perf_counter()
+        try:
+            job()
+        except Exception as e:
+            log.exception("Autosave (%s) failed", kind)
+            self.last_error = e
+            # A failed snapshot loses the records mark_snapshot() moved into it just as surely
+            self._journal_gap = True
+            with self._lock:
+                self._needs_snapshot = True  # Whatever was lost is still in memory
+            raise
+        if kind == "snapshot":
+            self._journal_gap = False
+        self.last_latency = time.perf_counter() - begin
+        self.last_error = None
+        if self.metrics.enabled:
+            self.metrics.timing("autosave").add(self.last_latency)
+        log.debug("Autosave (%s) took %.1f ms", kind, self.last_latency * 1000)
+
+    def close(self):
+        """Write whatever is left and wait for every queued save to finish.
+
+        Returns the exception of the final save if it failed, else None.
+        """
+        # Let the queued saves finish first, so the last one knows whether it must be a snapshot
+        if self._future is not None:
+            wait([self._future])
+        future = self.save()
+        self._executor.shutdown(wait=True)
+        return future.exception() if future is not None else None
@@ -0,0 +1,74 @@
+"""Run slow work on a worker thread and hand its result to the Tk thread.
+
+Tk may only be used from the thread running mainloop, so a worker never calls
+into Tk. It stores its progress and result on a BackgroundTask, and the Tk
+thread picks them up by polling with root.after (see poll_task).
+"""
+import threading
+
+# How often the Tk thread checks on a running task
+POLL_MS = 50
+
+
+class BackgroundTask:
+    """Runs func(report) on a daemon thread.
+
+    func may call report(done, total, status) as often as it likes; the latest
+    call is kept in progress. When func returns, its value is in result, or
+    the exception it raised is in error.
+    """
+
+    def __init__(self, func, name="background"):
+        self.progress = (0, 0, "")
+        self.result = None
+        self.error = None
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(func,), name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def report(self, done, total, status=""):
+        self.progress = (done, total, status)  # One assignment, so readers never see a torn update
+
+    def _run(self, func):
+        try:
+            self.result = func(self.report)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._finished.set()
+
+    def done(self):
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the task finishes, then return its result or raise its error."""
+        if not self._finished.wait(timeout):
+            raise TimeoutError(f"{self._thread.name} did not finish in {timeout} s")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def poll_task(root, task, on_done, on_progress=None, on_error=None, interval=POLL_MS):
+    """Check on task from the Tk thread every interval ms until it finishes.
+
+    Calls on_progress(done, total, status) on every check, then on_done(result)
+    or on_error(exception) once. Without on_error the exception is raised in
+    the Tk callback.
+    """
+    def check():
+        if on_progress is not None:
+            on_progress(*task.progress)
+        if not task.done():
+            root.after(interval, check)
+        elif task.error is not None:
+            if on_error is None:
+                raise task.error
+            on_error(task.error)
+        else:
+            on_done(task.result)
+
+    check()
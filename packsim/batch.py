@@ -0,0 +1,83 @@
+"""Headless bulk pack opening, rolling every pack of a batch at once with NumPy."""
+import numpy as np
+
+from packsim.config import (
+    CARD_PACKS, SHINY_CHANCE, SHADOW_CHANCE, COLD_CHANCE, REFUND_CHANCE,
+    EASTER_EGG_CHANCE,
+)
+from packsim.cards import (
+    RARITIES, RARITY_IDS, VARIANT_NONE, VARIANT_SHADOW, VARIANT_SHINY, VARIANT_COLD,
+    card_code,
+)
+from packsim.game import MILLION_COINS, OUTCOME_REFUND, OUTCOME_EASTER_EGG, OpenResult
+from packsim.rng import RngService
+from packsim.samplers import SAMPLERS
+
+# One row per opened pack. "outcome" holds the game's OUTCOME_* codes; columns that
+# do not apply to a row stay 0 (e.g. "egg" on a normal card)
+RESULT_DTYPE = np.dtype([
+    ("outcome", np.uint8),
+    ("rarity", np.uint8),
+    ("variant", np.uint8),
+    ("egg", np.uint8),
+])
+
+# Rarities that never roll a variant (cold packs already are "cold")
+_NO_VARIANT = np.array(["cold" in rarity.lower() for rarity in RARITIES])
+
+
+def open_packs(pack_name, n, rng=None):
+    """Open n packs of one type and return one RESULT_DTYPE row per pack.
+
+    rng may be an RngService, a numpy Generator or anything np.random.default_rng
+    accepts (a seed, None for fresh entropy). The rolls match generate_card in distribution: a refund
+    roll, then an Easter egg roll, then the rarity and variant of a normal card.
+    """
+    rng = rng.numpy() if isinstance(rng, RngService) else np.random.default_rng(rng)
+    results = np.zeros(n, dtype=RESULT_DTYPE)
+
+    refund = rng.random(n) <= REFUND_CHANCE
+    easter_egg = ~refund & (rng.random(n) <= EASTER_EGG_CHANCE)
+    card = ~(refund | easter_egg)
+
+    outcome = results["outcome"]
+    outcome[refund] = OUTCOME_REFUND
+    outcome[easter_egg] = OUTCOME_EASTER_EGG
+
+    results["egg"][easter_egg] = SAMPLERS.easter_egg().draw_indices(int(easter_egg.sum()), rng)
+
+    sampler = SAMPLERS.pack(pack_name)
+    pack_rarities = np.array([RARITY_IDS[r] for r in sampler.outcomes], dtype=np.uint8)
+    n_cards = int(card.sum())
+    rarities = pack_rarities[sampler.draw_indices(n_cards, rng)]
+
+    variant_roll = rng.random(n_cards)
+    variants = np.select(
+        [variant_roll <= SHADOW_CHANCE,
+         variant_roll <= SHINY_CHANCE + SHADOW_CHANCE,
+         variant_roll <= COLD_CHANCE + SHINY_CHANCE + SHADOW_CHANCE],
+        [VARIANT_SHADOW, VARIANT_SHINY, VARIANT_COLD],
+        VARIANT_NONE,
+    ).astype(np.uint8)
+    variants[_NO_VARIANT[rarities]] = VARIANT_NONE
+
+    results["rarity"][card] = rarities
+    results["variant"][card] = variants
+    return results
+
+
+def to_open_result(pack_name, result):
+    """Convert one result row to the OpenResult that GameState.open_pack would return."""
+    outcome = int(result["outcome"])
+    if outcome == OUTCOME_REFUND:
+        return OpenResult(pack_name, outcome, coins=CARD_PACKS[pack_name]["cost"] * 2)
+    if outcome == OUTCOME_EASTER_EGG:
+        easter_egg_choice = SAMPLERS.easter_egg().outcomes[result["egg"]]
+        coins = MILLION_COINS if easter_egg_choice == "Million Coins" else 0
+        return OpenResult(pack_name, outcome, coins=coins, easter_egg=easter_egg_choice)
+    return OpenResult(pack_name, outcome, card=card_code(int(result["rarity"]), int(result["variant"])))
+
+
+def describe_result(pack_name, result):
+    """Return the message the game would have shown for one result row."""
+    return to_open_result(pack_name, result).message
@@ -0,0 +1,126 @@
+"""Ship the game as precompiled code objects instead of source: build a bundle, import from it.
+
+A bundle is one file: MAGIC, the interpreter's bytecode magic number, then a
+zlib-compressed marshal of {module name: (is_package, marshalled code)}. It
+holds no source text. install() adds an import hook that unmarshals a
+module's code object the first time the module is imported, which costs the
+same as loading a .pyc. Code is compiled with its real file name, so
+tracebacks still show the module and line number.
+
+    python -m packsim.bundle            # writes game.bundle next to mainEncrypted.py
+
+A bundle only loads on the Python version that built it.
+"""
+import importlib.abc
+import importlib.util
+import marshal
+import os
+import sys
+import zlib
+
+MAGIC = b"PKSB"
+BUNDLE_FILENAME = "game.bundle"
+
+# The packages compiled into a bundle
+BUNDLED_PACKAGES = ("packsim",)
+
+
+class BundleError(ImportError):
+    """The bundle is missing, damaged, or was built by another Python version."""
+
+
+def _package_modules(package, root):
+    """Yield (module name, source path, is_package) for every module of a package."""
+    package_dir = os.path.join(root, *package.split("."))
+    for dirpath, dirnames, filenames in os.walk(package_dir):
+        dirnames[:] = sorted(d for d in dirnames if os.path.exists(os.path.join(dirpath, d, "__init__.py")))
+        rel = os.path.relpath(dirpath, root)
+        prefix = ".".join(rel.split(os.sep))
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            if filename == "__init__.py":
+                yield prefix, os.path.join(dirpath, filename), True
+            else:
+                yield f"{prefix}.{filename[:-3]}", os.path.join(dirpath, filename), False
+
+
+def build_bundle(output, root=None, packages=BUNDLED_PACKAGES, optimize=0):
+    """Compile every module of packages (found under root) into one bundle file.
+
+    Returns the names of the modules written.
+    """
+    if root is None:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    modules = {}
+    for package in packages:
+        for name, path, is_package in _package_modules(package, root):
+            with open(path, "rb") as f:
+                source = f.read()
+            # The relative path keeps the build machine's directories out of the bundle
+            filename = os.path.relpath(path, root).replace(os.sep, "/")
+            code = compile(source, filename, "exec", dont_inherit=True, optimize=optimize)
+            modules[name] = (is_package, marshal.dumps(code))
+
+    payload = MAGIC + importlib.util.MAGIC_NUMBER + zlib.compress(marshal.dumps(modules), 9)
+    tmp = f"{output}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, output)
+    return sorted(modules)
+
+
+class BundleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Finds and loads modules from a bundle file."""
+
+    def __init__(self, path, root=None):
+        with open(path, "rb") as f:
+            data = f.read()
+        header = MAGIC + importlib.util.MAGIC_NUMBER
+        if not data.startswith(MAGIC):
+            raise BundleError(f"{path} is not a game bundle.")
+        if not data.startswith(header):
+            raise BundleError(f"{path} was built by a different Python version; rebuild it with "
+                              f"python -m packsim.bundle.")
+        try:
+            self.modules = marshal.loads(zlib.decompress(data[len(header):]))
+        except (zlib.error, ValueError, EOFError) as e:
+            raise BundleError(f"{path} is damaged: {e}") from None
+        # Data files (such as packsim/catalog.json) are looked up next to where the module would be
+        self.root = root if root is not None else os.path.dirname(os.path.abspath(path))
+
+    def find_spec(self, fullname, path=None, target=None):
+        entry = self.modules.get(fullname)
+        if entry is None:
+            return None
+        is_package = entry[0]
+        parts = fullname.split(".")
+        if is_package:
+            origin = os.path.join(self.root, *parts, "__init__.py")
+        else:
+            origin = os.path.join(self.root, *parts) + ".py"
+        spec = importlib.util.spec_from_loader(fullname, self, origin=origin, is_package=is_package)
+        spec.has_location = True  # Sets __file__, which modules use to find their data files
+        if is_package:
+            spec.submodule_search_locations = [os.path.dirname(origin)]
+        return spec
+
+    def create_module(self, spec):
+        return None  # The default module object
+
+    def exec_module(self, module):
+        _is_package, code = self.modules[module.__name__]
+        exec(marshal.loads(code), module.__dict__)
+
+
+def install(path, root=None):
+    """Put a bundle first on the import path; returns its BundleFinder."""
+    finder = BundleFinder(path, root)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+if __name__ == "__main__":
+    output = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), BUNDLE_FILENAME)
+    names = build_bundle(output)
+    print(f"Wrote {len(names)} modules to {output}")
@@ -0,0 +1,206 @@
+"""Compact integer cards: a rarity id and a variant id packed into one small int."""
+from array import array
+
+from packsim.catalog import (
+    CATALOG, VARIANT_NONE, VARIANT_SHADOW, VARIANT_SHINY, VARIANT_COLD, VARIANT_PREFIXES, VARIANT_BITS,
+)
+
+# Every rarity across all packs, numbered in order of first appearance
+RARITIES = CATALOG.rarities
+RARITY_IDS = {rarity: i for i, rarity in enumerate(RARITIES)}
+CARD_CODE_COUNT = len(RARITIES) << VARIANT_BITS
+
+
+def card_code(rarity_id, variant_id=VARIANT_NONE):
+    """Pack a rarity id and variant id into a card code."""
+    return rarity_id << VARIANT_BITS | variant_id
+
+
+def card_rarity(code):
+    """Return the rarity id of a card code."""
+    return code >> VARIANT_BITS
+
+
+def card_variant(code):
+    """Return the variant id of a card code."""
+    return code & ((1 << VARIANT_BITS) - 1)
+
+
+# Display names are rendered once per code (by the catalog compiler), exactly as
+# generate_card used to spell them
+CARD_NAMES = CATALOG.card_names
+_CODES_BY_NAME = {name: code for code, name in enumerate(CARD_NAMES)}
+# Case-insensitive fallback for hand-edited saves; plain rarities are inserted last so
+# "cold rare card" means the Cold Pack rarity rather than a Cold variant of "rare"
+_CODES_BY_LOWER_NAME = {}
+for _variant in (VARIANT_SHADOW, VARIANT_SHINY, VARIANT_COLD, VARIANT_NONE):
+    for _rarity_id in range(len(RARITIES)):
+        _code = card_code(_rarity_id, _variant)
+        _CODES_BY_LOWER_NAME[CARD_NAMES[_code].lower()] = _code
+
+
+def card_name(code):
+    """Render a card code for display, e.g. "Shiny Epic Card"."""
+    return CARD_NAMES[code]
+
+
+def parse_card_name(name):
+    """Return the card code for a card name from an old string-based save."""
+    code = _CODES_BY_NAME.get(name)
+    if code is None:
+        code = _CODES_BY_LOWER_NAME.get(name.strip().lower())
+    if code is None:
+        raise ValueError(f"Unknown card: {name!r}")
+    return code
+
+
+class Card:
+    """Lightweight view over one card code."""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code):
+        self.code = code
+
+    @property
+    def rarity(self):
+        return RARITIES[card_rarity(self.code)]
+
+    @property
+    def variant(self):
+        return card_variant(self.code)
+
+    @property
+    def name(self):
+        return CARD_NAMES[self.code]
+
+    def __str__(self):
+        return CARD_NAMES[self.code]
+
+    def __repr__(self):
+        return f"Card({CARD_NAMES[self.code]!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, Card) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+
+class CardCollection:
+    """The player's cards as a count per card code, stored in a flat array.
+
+    Adding or removing a card of a given code is O(1). Cards can still be
+    addressed by list position (grouped by code) for screens that sell by
+    index; that walks the counts, so it costs O(number of card codes).
+    """
+
+    TYPECODE = "Q"
+
+    def __init__(self, codes=()):
+        self.counts = array(self.TYPECODE, [0]) * CARD_CODE_COUNT
+        self._size = 0
+        for code in codes:
+            self.add(code)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def count(self, code):
+        return self.counts[code]
+
+    def add(self, code, quantity=1):
+        """Add quantity cards of one code."""
+        self.counts[code] += quantity
+        self._size += quantity
+
+    append = add
+
+    def remove(self, code, quantity=1):
+        """Remove quantity cards of one code, raising ValueError if there are not enough."""
+        have = self.counts[code]
+        if quantity > have:
+            raise ValueError(f"Only {have} of {CARD_NAMES[code]!r} held, cannot remove {quantity}")
+        self.counts[code] = have - quantity
+        self._size -= quantity
+
+    def groups(self):
+        """Return (code, count) pairs for every card code held."""
+        return [(code, count) for code, count in enumerate(self.counts) if count]
+
+    def iter_codes(self):
+        """Yield the code of every card, grouped by code."""
+        for code, count in enumerate(self.counts):
+            for _ in range(count):
+                yield code
+
+    def _code_at(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("card index out of range")
+        for code, count in enumerate(self.counts):
+            if index < count:
+                return code
+            index -= count
+
+    def __getitem__(self, index):
+        return Card(self._code_at(index))
+
+    def __iter__(self):
+        return map(Card, self.iter_codes())
+
+    def pop(self, index=-1):
+        """Remove the card at a list position and return its code."""
+        code = self._code_at(index)
+        self.remove(code)
+        return code
+
+    def detach(self):
+        """Copy counts held in a mapped buffer into a private array, releasing the mapping."""
+        if not isinstance(self.counts, array):
+            counts = self.counts
+            self.counts = array(self.TYPECODE, counts)
+            counts.release()
+
+    def names(self):
+        """Render every card for display."""
+        return [CARD_NAMES[code] for code in self.iter_codes()]
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Wrap an existing buffer of per-code counts (e.g. a memory-mapped column) without copying."""
+        collection = cls.__new__(cls)
+        collection.counts = counts
+        collection._size = sum(counts)
+        return collection
+
+    @classmethod
+    def from_names(cls, names):
+        """Convert the list of card strings kept by older saves."""
+        return cls(parse_card_name(name) for name in names)
+
+    def to_save(self):
+        """Return (rarity names, {code: count}) so a save survives rarities being added or reordered."""
+        return RARITIES, dict(self.groups())
+
+    @classmethod
+    def from_save(cls, data):
+        """Load what to_save produced, a decoded collection, or an older save's card list."""
+        if isinstance(data, cls):
+            return data
+        if isinstance(data, list):
+            return cls.from_names(data)
+        rarities, cards = data
+        # Saves from before counting stored one code per card
+        counts = cards.items() if isinstance(cards, dict) else ((code, 1) for code in cards)
+        remap = None if tuple(rarities) == RARITIES else [RARITY_IDS[rarity] for rarity in rarities]
+        collection = cls()
+        for code, count in counts:
+            if remap is not None:
+                code = card_code(remap[card_rarity(code)], card_variant(code))
+            collection.add(code, count)
+        return collection
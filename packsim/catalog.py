@@ -0,0 +1,272 @@
+"""The pack catalog: read from catalog.json, validated, and compiled into read-only tables.
+
+Compiling turns the catalog into everything the game looks up while playing:
+rarity ids, card names, the price table, icon paths and alias tables. The
+result is cached on disk next to the catalog, under a hash of the catalog
+file and of the compiler's own code, so a bigger catalog does not make
+startup slower and editing the compiler never serves a stale cache. This module imports nothing else from
+packsim, so config, cards, pricing and samplers can all be built on it.
+"""
+import hashlib
+import json
+import logging
+import marshal
+import os
+import pickle
+import re
+import tempfile
+from types import MappingProxyType
+from typing import NamedTuple
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.json")
+CACHE_DIR = os.path.join(os.path.dirname(CATALOG_FILE), ".catalog_cache")
+
+# Variant ids, in the order generate_card rolls them
+VARIANT_NONE = 0
+VARIANT_SHADOW = 1
+VARIANT_SHINY = 2
+VARIANT_COLD = 3
+VARIANT_PREFIXES = ("", "Shadow ", "Shiny ", "Cold ")
+VARIANT_BITS = 2
+
+CURRENCIES = ("coins", "snow", "special")
+CHANCES = ("shiny", "shadow", "cold", "refund", "easter_egg")
+MILLION_COINS_EGG = "Million Coins"
+
+log = logging.getLogger(__name__)
+
+
+class CatalogError(ValueError):
+    """The catalog file is missing, is not valid JSON, or breaks a rule of the game."""
+
+
+class Catalog(NamedTuple):
+    """The compiled catalog. Every mapping is read-only."""
+
+    card_packs: MappingProxyType          # Pack name -> {"cost", "currency", "rarity_distribution", ...}
+    chances: MappingProxyType             # "shiny", "shadow", "cold", "refund", "easter_egg" -> probability
+    easter_egg_options: MappingProxyType  # Option -> weight
+    base_prices: MappingProxyType         # Rarity -> coins
+    rarities: tuple                       # Every rarity, numbered in order of first appearance
+    card_names: tuple                     # Display name of every card code
+    price_table: tuple                    # Sell price of every card code
+    icon_paths: MappingProxyType          # Pack name -> image path
+    sampler_tables: MappingProxyType      # Pack name -> (outcomes, prob, alias)
+    easter_egg_table: tuple               # (outcomes, prob, alias) of easter_egg_options
+
+
+def price_from_name(card, base_prices):
+    """Price a card name by matching rarities longest first, then applying the variant.
+
+    This is the rule the market has always used. It is slow, so it only runs to
+    build the price table; returns None if no rarity matches.
+    """
+    card_lower = card.lower().strip()
+
+    # Check for more specific rarities first
+    for rarity in sorted(base_prices, key=len, reverse=True):
+        if re.search(r'\b' + re.escape(rarity) + r'\b', card_lower):
+            price = base_prices[rarity]
+            break
+    else:
+        return None
+
+    # Adjust the price based on card variants
+    if "shiny" in card_lower:
+        price *= 2
+    elif "shadow" in card_lower:
+        price *= 3
+    elif "cold" in card_lower and "cold" not in rarity:
+        price *= 2
+    return price
+
+
+def alias_tables(weights):
+    """Build Vose alias tables for a list of weights; returns (prob, alias) tuples."""
+    total = sum(weights)
+    if not weights or total <= 0:
+        raise ValueError(f"Cannot build a sampler from weights {weights!r}")
+
+    size = len(weights)
+    scaled = [w * size / total for w in weights]
+    prob = [1.0] * size
+    alias = list(range(size))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Whatever is left over is 1.0 up to rounding error
+
+    return tuple(prob), tuple(alias)
+
+
+def card_names(rarities):
+    """Render the display name of every card code, e.g. "Shiny Epic Card"."""
+    variant_mask = (1 << VARIANT_BITS) - 1
+    return tuple(
+        f"{VARIANT_PREFIXES[code & variant_mask]}{rarities[code >> VARIANT_BITS].capitalize()} Card"
+        for code in range(len(rarities) << VARIANT_BITS)
+    )
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_catalog(data):
+    """Raise CatalogError listing every problem with a parsed catalog."""
+    problems = []
+    if not isinstance(data, dict):
+        raise CatalogError("The catalog must be a JSON object.")
+    packs = data.get("packs")
+    if not isinstance(packs, dict) or not packs:
+        raise CatalogError("The catalog has no packs.")
+
+    for name, info in packs.items():
+        if not isinstance(info, dict):
+            problems.append(f"{name}: must be an object")
+            continue
+        cost = info.get("cost")
+        if not isinstance(cost, int) or isinstance(cost, bool) or cost < 0:
+            problems.append(f"{name}: cost must be a whole number of at least 0")
+        if info.get("currency") not in CURRENCIES:
+            problems.append(f"{name}: currency must be one of {', '.join(CURRENCIES)}")
+        if not isinstance(info.get("icon_path"), str):
+            problems.append(f"{name}: icon_path must be a string")
+        if not isinstance(info.get("purchasable", True), bool):
+            problems.append(f"{name}: purchasable must be true or false")
+        distribution = info.get("rarity_distribution")
+        if not isinstance(distribution, dict) or not distribution:
+            problems.append(f"{name}: rarity_distribution must list at least one rarity")
+        elif not all(_is_number(w) and w > 0 for w in distribution.values()):
+            problems.append(f"{name}: rarity weights must be positive numbers")
+
+    chances = data.get("chances", {})
+    for key in CHANCES:
+        value = chances.get(key)
+        if not _is_number(value) or not 0 <= value <= 1:
+            problems.append(f"chances.{key} must be a number from 0 to 1")
+    if not problems and chances["shiny"] + chances["shadow"] + chances["cold"] > 1:
+        problems.append("chances.shiny + chances.shadow + chances.cold must not exceed 1")
+
+    options = data.get("easter_egg_options")
+    if not isinstance(options, dict) or not options:
+        problems.append("easter_egg_options must list at least one option")
+    else:
+        for option, weight in options.items():
+            if option != MILLION_COINS_EGG and option not in packs:
+                problems.append(f"easter_egg_options: {option} is not a pack")
+            if not _is_number(weight) or weight <= 0:
+                problems.append(f"easter_egg_options: {option} must have a positive weight")
+
+    base_prices = data.get("base_prices")
+    if not isinstance(base_prices, dict) or not all(_is_number(p) and p >= 0 for p in base_prices.values()):
+        problems.append("base_prices must map rarities to prices of at least 0")
+    elif not problems:
+        for rarity in _rarities(packs):
+            if price_from_name(f"{rarity.capitalize()} Card", base_prices) is None:
+                problems.append(f"No base price matches the rarity {rarity!r}")
+
+    if problems:
+        raise CatalogError("Invalid catalog:\n" + "\n".join(problems))
+
+
+def _rarities(packs):
+    return tuple(dict.fromkeys(rarity for info in packs.values() for rarity in info["rarity_distribution"]))
+
+
+def compile_catalog(data):
+    """Validate a parsed catalog and return the compiled tables as plain, picklable data."""
+    validate_catalog(data)
+    packs = data["packs"]
+    rarities = _rarities(packs)
+    names = card_names(rarities)
+    base_prices = data["base_prices"]
+
+    sampler_tables = {}
+    for name, info in packs.items():
+        distribution = info["rarity_distribution"]
+        sampler_tables[name] = (tuple(distribution),) + alias_tables(list(distribution.values()))
+    options = data["easter_egg_options"]
+
+    return {
+        "card_packs": packs,
+        "chances": data["chances"],
+        "easter_egg_options": options,
+        "base_prices": base_prices,
+        "rarities": rarities,
+        "card_names": names,
+        "price_table": tuple(price_from_name(name, base_prices) or 0 for name in names),
+        "icon_paths": {name: info["icon_path"] for name, info in packs.items()},
+        "sampler_tables": sampler_tables,
+        "easter_egg_table": (tuple(options),) + alias_tables(list(options.values())),
+    }
+
+
+def _compiler_fingerprint():
+    # The compiled bytecode of everything compile_catalog runs; works from source and from a bundle
+    functions = (price_from_name, alias_tables, card_names, _is_number, validate_catalog, _rarities,
+                 compile_catalog)
+    return hashlib.sha256(b"".join(marshal.dumps(func.__code__) for func in functions)).digest()
+
+
+def _freeze(compiled):
+    frozen = dict(compiled)
+    frozen["card_packs"] = MappingProxyType({
+        name: MappingProxyType(dict(info, rarity_distribution=MappingProxyType(info["rarity_distribution"])))
+        for name, info in compiled["card_packs"].items()
+    })
+    for key in ("chances", "easter_egg_options", "base_prices", "icon_paths", "sampler_tables"):
+        frozen[key] = MappingProxyType(compiled[key])
+    return Catalog(**frozen)
+
+
+def _write_cache(path, compiled):
+    # A lost or unwritable cache only means compiling again next time, so no fsync
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def load_catalog(path=CATALOG_FILE, cache_dir=CACHE_DIR):
+    """Return the compiled Catalog for a catalog file, compiling it only if it changed."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        raise CatalogError(f"Cannot read the catalog {path}: {e}") from None
+
+    key = hashlib.sha256(raw + b"\0" + _compiler_fingerprint()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.pickle") if cache_dir else None
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                compiled = pickle.load(f)
+            log.debug("Loaded the compiled catalog from %s", cache_path)
+            return _freeze(compiled)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise CatalogError(f"The catalog {path} is not valid JSON: {e}") from None
+    compiled = compile_catalog(data)
+    log.info("Compiled the catalog %s", path)
+    if cache_path is not None:
+        _write_cache(cache_path, compiled)
+    return _freeze(compiled)
+
+
+CATALOG = load_catalog()
@@ -0,0 +1,501 @@
+"""The classic game that mainEncrypted.py starts: the original list-based version of the app."""
+import tkinter as tk
+import os
+import random
+import sys
+from tkinter import messagebox, Canvas, Scrollbar, Frame
+
+# Packs, drop rates and prices come from the shared catalog (packsim/catalog.json)
+from packsim.atlas import ATLAS_INDEX, AtlasAssets
+from packsim.background import BackgroundTask, poll_task
+from packsim.config import CARD_PACKS, SHINY_CHANCE, SHADOW_CHANCE, COLD_CHANCE, REFUND_CHANCE
+from packsim.instrument import METRICS, METRICS_FILE, instrumented
+from packsim.cards import CardCollection, parse_card_name
+from packsim.game import GameState
+from packsim.inventory import CountedInventory
+from packsim.journal import Journal
+from packsim.pricing import card_price
+from packsim.saves import read_save, write_save
+from packsim.startup import StartupProfile, after_first_paint
+
+# PyInstaller unpacks the image atlas next to the bundle, not into the working directory
+ATLAS_PATH = os.path.join(getattr(sys, "_MEIPASS", ""), ATLAS_INDEX)
+
+# The save (and its journal) is shared with the main game
+SAVE_FILENAME = "savegame.pkl"
+JOURNAL_FILENAME = os.path.splitext(SAVE_FILENAME)[0] + ".journal"
+
+def save_game(data, filename=SAVE_FILENAME):
+    write_save(data, filename)
+    messagebox.showinfo("Save Game", "Game progress saved successfully!")
+
+def load_game(filename=SAVE_FILENAME):
+    """Load the save and replay the main game's journal into a GameState.
+
+    Returns (game, whether there was any progress to load). Runs on the loader
+    thread, so it must not show dialogs. Old pickled saves are read by
+    read_save's restricted unpickler.
+    """
+    try:
+        saved_data = read_save(filename)
+    except FileNotFoundError:
+        saved_data = None
+    if saved_data is not None:
+        game = GameState.from_save(saved_data)
+        journal_seq = saved_data[9]
+    else:
+        game = GameState()
+        journal_seq = 0
+    game.attach_journal(Journal(JOURNAL_FILENAME), after_seq=journal_seq)
+    return game, saved_data is not None or game.journal.seq > journal_seq
+
+class CardGameApp:
+    def __init__(self, root, profile=None):
+        self.root = root
+        self.root.title("Card Pack Opening Game")
+        self.root.attributes('-fullscreen', True)
+
+        self.player_currency = 180
+        self.player_snow = 0  # New Snow currency
+        self.player_inventory = []
+        self.player_cards = []
+        self.currency_label = None
+        self.snow_label = None  # Label for Snow currency
+
+        self.assets = None
+        self.loaded = False
+        self.game = None  # What was loaded; keeps the main game's stats for the next save
+        self.profile = profile if profile is not None else StartupProfile()
+        self.profile.mark("imports")
+
+        # The save loads on a worker thread while the main menu is on screen (see load_state)
+        self.main_menu()
+        self.loader = BackgroundTask(self.load_state, name="save-loader").start()
+        after_first_paint(self.root, self.first_frame)
+
+    def load_state(self, report):
+        """Read the save; runs on the loader thread, so nothing here may touch Tk."""
+        with self.profile.phase("save load"):
+            return load_game()
+
+    def first_frame(self):
+        """Loads the pack images once the main menu has been drawn, then waits for the save."""
+        self.profile.mark("first frame")
+        with self.profile.phase("asset load"):
+            self.load_icons()
+        poll_task(self.root, self.loader, self.finish_startup, on_error=self.load_failed)
+
+    def finish_startup(self, loaded):
+        """Takes over the loaded save on the Tk thread and enables the menu."""
+        self.game, save_found = loaded
+        if save_found:
+            self.player_currency = self.game.coins
+            self.player_snow = self.game.snow
+            self.player_inventory = list(self.game.packs)
+            self.player_cards = self.game.cards.names()
+        self.loaded = True
+
+        self.start_coin_reward_system()
+        self.main_menu()
+        self.profile.mark("ready")
+        self.profile.report()
+        if save_found:
+            messagebox.showinfo("Load Game", "Game progress loaded successfully!")
+        else:
+            messagebox.showwarning("Load Game", "No saved game found.")
+
+    def load_failed(self, error):
+        """Reports a save that could not be read and closes the game without overwriting it."""
+        messagebox.showerror("Load Game", f"Could not load the saved game: {error}")
+        self.root.quit()
+
+    def load_icons(self):
+        """Load the pack images, cut from the prebuilt atlas when there is one."""
+        def on_missing(message):
+            messagebox.showerror("Error", message)
+
+        # The atlas (python -m packsim.atlas) is one file read and needs no Pillow
+        if os.path.exists(ATLAS_PATH):
+            self.assets = AtlasAssets(ATLAS_PATH, on_missing=on_missing)
+        else:
+            from packsim.assets import AssetManager
+            self.assets = AssetManager(CARD_PACKS, on_missing=on_missing)
+        self.assets.preload_icons()
+
+    def pack_icon(self, pack_name):
+        """The 50x50 icon of a pack, or None until the images are loaded."""
+        return self.assets.icon(pack_name) if self.assets is not None else None
+
+    def pack_animation_image(self, pack_name):
+        """The 200x200 opening image of a pack, or None until the images are loaded."""
+        return self.assets.animation(pack_name) if self.assets is not None else None
+
+    def start_coin_reward_system(self):
+        """Awards the player 20 coins every 2 minutes."""
+        self.player_currency += 20
+        self.update_currency_display()
+        self.root.after(2 * 60 * 1000, self.start_coin_reward_system)
+
+    def update_currency_display(self):
+        """Updates the currency display in the top right corner of the window."""
+        # Remove the old labels if they exist
+        if self.currency_label:
+            self.currency_label.destroy()
+        if self.snow_label:
+            self.snow_label.destroy()
+
+        # Create new labels to display the current currency
+        self.currency_label = tk.Label(self.root, text=f"Coins: {self.player_currency}", font=("Helvetica", 14))
+        self.currency_label.place(relx=0.98, rely=0.02, anchor='ne')
+
+        self.snow_label = tk.Label(self.root, text=f"Snow: {self.player_snow}", font=("Helvetica", 14))
+        self.snow_label.place(relx=0.98, rely=0.07, anchor='ne')
+
+    def main_menu(self):
+        """Main menu setup."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="Card Pack Opening Game", font=("Helvetica", 24)).pack(pady=20)
+
+        # Until the save is loaded, anything the player did would be overwritten by it
+        state = tk.NORMAL if self.loaded else tk.DISABLED
+        tk.Button(self.root, text="Shop", width=20, command=self.shop_menu, state=state).pack(pady=10)
+        tk.Button(self.root, text="Inventory", width=20, command=self.inventory_menu, state=state).pack(pady=10)
+        tk.Button(self.root, text="Market", width=20, command=self.market_menu, state=state).pack(pady=10)
+        tk.Button(self.root, text="Convert Currency", width=20, command=self.convert_currency_menu, state=state).pack(pady=10)
+        tk.Button(self.root, text="Save Progress", width=20, command=self.save_progress, state=state).pack(pady=10)
+        tk.Button(self.root, text="Exit", width=20, command=self.root.quit).pack(pady=10)
+
+    def convert_currency_menu(self):
+        """Menu to convert between Coins and Snow."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="Convert Currency", font=("Helvetica", 18)).pack(pady=20)
+
+        # Conversion from Coins to Snow
+        tk.Button(self.root, text="Convert 250 Coins to 1 Snow",
+                  width=30, command=self.convert_coins_to_snow).pack(pady=5)
+
+        # Conversion from Snow to Coins
+        tk.Button(self.root, text="Convert 1 Snow to 250 Coins",
+                  width=30, command=self.convert_snow_to_coins).pack(pady=5)
+
+        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
+
+    def convert_coins_to_snow(self):
+        """Converts 250 Coins to 1 Snow."""
+        if self.player_currency >= 250:
+            self.player_currency -= 250
+            self.player_snow += 1
+            self.update_currency_display()
+            messagebox.showinfo("Conversion Successful", "Converted 250 Coins to 1 Snow!")
+        else:
+            messagebox.showerror("Error", "Not enough coins to convert!")
+        self.convert_currency_menu()
+
+    def convert_snow_to_coins(self):
+        """Converts 1 Snow to 250 Coins."""
+        if self.player_snow >= 1:
+            self.player_snow -= 1
+            self.player_currency += 250
+            self.update_currency_display()
+            messagebox.showinfo("Conversion Successful", "Converted 1 Snow to 250 Coins!")
+        else:
+            messagebox.showerror("Error", "Not enough Snow to convert!")
+        self.convert_currency_menu()
+
+    def shop_menu(self):
+        """Display the shop menu where players can buy packs."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        # Create a canvas and a frame that will hold all the pack buttons
+        canvas = tk.Canvas(self.root)
+        scroll_y = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
+        scroll_y.pack(anchor="center")
+
+        # This frame will be where the actual widgets (buttons, labels) are placed
+        scrollable_frame = tk.Frame(canvas)
+
+        # Function to configure scroll region
+        def on_frame_configure(event):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        # Add a binding to the mouse scroll wheel
+        def _on_mouse_wheel(event):
+            canvas.yview_scroll(-1 * int((event.delta / 120)), "units")
+
+        scrollable_frame.bind("<Configure>", on_frame_configure)
+        canvas.bind_all("<MouseWheel>", _on_mouse_wheel)
+
+        # Create a window inside the canvas to hold the scrollable frame
+        new_window_with = 800
+        window_width = self.root.winfo_width()
+        canvas.create_window(((window_width-new_window_with)//2, 0), window=scrollable_frame, anchor="nw", width=new_window_with)
+        canvas.configure(yscrollcommand=scroll_y.set)
+
+        # Title
+        tk.Label(scrollable_frame, text="Shop", font=("Helvetica", 18)).pack(pady=20)
+
+        # Outer frame to help with centering
+        outer_frame = tk.Frame(scrollable_frame)
+        outer_frame.pack(anchor="center")
+
+        # Pack frame that will hold the pack options
+        pack_frame = tk.Frame(outer_frame)
+        pack_frame.pack(anchor="center", pady=20)
+
+        # Add pack options inside pack_frame
+        for pack_name, pack_info in CARD_PACKS.items():
+            if not pack_info.get("purchasable", True):
+                continue  # Skip Easter Egg packs (not purchasable)
+            icon = self.pack_icon(pack_name)
+
+            frame = tk.Frame(pack_frame)
+            frame.pack(pady=5)
+
+            # Determine the currency to display
+            currency_type = "Coins" if pack_info["currency"] == "coins" else "Snow"
+            cost_text = f"{pack_info['cost']} {currency_type}"
+
+            tk.Label(frame, image=icon).pack(side='left', padx=10)
+            tk.Button(frame, text=f"{pack_name} - {cost_text}",
+                    width=30,
+                    command=lambda name=pack_name: self.select_pack_quantity(name)).pack(side='left')
+
+        # Position the back button at the bottom of the scrollable_frame, centered
+        tk.Button(scrollable_frame, text="Back", width=20, command=self.main_menu).pack(pady=20)
+
+        # Pack everything in the main root window
+        canvas.pack(side="left", fill="both", expand=True)
+        scroll_y.pack(side="right", fill="y")
+
+    def select_pack_quantity(self, pack_name):
+        """Display a menu to select the quantity of packs to buy."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text=f"Buy {pack_name}", font=("Helvetica", 18)).pack(pady=20)
+
+        def purchase(quantity):
+            self.buy_pack(pack_name, quantity)
+
+        for i in range(1, 6):  # Allows selection of 1 to 5 packs
+            tk.Button(self.root, text=f"Buy {i} {pack_name}(s)",
+                      width=30,
+                      command=lambda quantity=i: purchase(quantity)).pack(pady=5)
+
+        tk.Button(self.root, text="Back", width=20, command=self.shop_menu).pack(pady=20)
+
+    def buy_pack(self, pack_name, quantity=1):
+        pack_info = CARD_PACKS[pack_name]
+        total_cost = pack_info["cost"] * quantity
+
+        if pack_info["currency"] == "coins":
+            if self.player_currency >= total_cost:
+                self.player_currency -= total_cost
+                self.player_inventory.extend([pack_name] * quantity)
+                messagebox.showinfo("Pack Purchased", f"You bought {quantity} {pack_name}(s)!")
+                self.inventory_menu()  # Go to inventory to reflect the purchase
+            else:
+                messagebox.showerror("Error", "Not enough currency!")
+                self.shop_menu()
+        elif pack_info["currency"] == "snow":
+            if self.player_snow >= total_cost:
+                self.player_snow -= total_cost
+                self.player_inventory.extend([pack_name] * quantity)
+                messagebox.showinfo("Pack Purchased", f"You bought {quantity} {pack_name}(s)!")
+                self.inventory_menu()  # Go to inventory to reflect the purchase
+            else:
+                messagebox.showerror("Error", "Not enough Snow!")
+                self.shop_menu()
+
+    def inventory_menu(self):
+        """Displays the inventory menu."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="Inventory", font=("Helvetica", 18)).pack(pady=20)
+
+        tk.Button(self.root, text="Open Packs", width=20, command=self.open_pack_inventory).pack(pady=10)
+        tk.Button(self.root, text="View Cards", width=20, command=self.card_inventory_menu).pack(pady=10)
+        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
+
+    def open_pack_inventory(self):
+        """Displays the list of packs available to open."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="Your Packs", font=("Helvetica", 18)).pack(pady=20)
+
+        if self.player_inventory:
+            for i, pack in enumerate(self.player_inventory):
+                icon = self.pack_icon(pack)
+                frame = tk.Frame(self.root)
+                frame.pack(pady=5)
+
+                tk.Label(frame, image=icon).pack(side='left', padx=10)
+                tk.Button(frame, text=f"Open {pack}",
+                          width=30,
+                          command=lambda idx=i: self.open_pack_animation(idx)).pack(side='left')
+        else:
+            tk.Label(self.root, text="No Packs in Inventory").pack(pady=10)
+
+        tk.Button(self.root, text="Back", width=20, command=self.inventory_menu).pack(pady=20)
+
+    def card_inventory_menu(self):
+        """Displays the player's card collection."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="Your Cards", font=("Helvetica", 18)).pack(pady=20)
+
+        if self.player_cards:
+            for card in self.player_cards:
+                tk.Label(self.root, text=card, font=("Helvetica", 14)).pack(pady=2)
+        else:
+            tk.Label(self.root, text="No Cards in Inventory").pack(pady=10)
+
+        tk.Button(self.root, text="Back", width=20, command=self.inventory_menu).pack(pady=20)
+
+    def market_menu(self):
+        """Displays the market where players can sell their cards."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="Market", font=("Helvetica", 18)).pack(pady=20)
+
+        if self.player_cards:
+            for i, card in enumerate(self.player_cards):
+                price = self.get_card_price(card)
+                tk.Button(self.root, text=f"Sell {card} for {price} Coins",
+                          width=40,
+                          command=lambda idx=i, price=price: self.sell_card(idx, price)).pack(pady=5)
+        else:
+            tk.Label(self.root, text="No Cards to Sell").pack(pady=10)
+
+        tk.Button(self.root, text="Back", width=20, command=self.main_menu).pack(pady=20)
+
+    def sell_card(self, index, price):
+        card = self.player_cards.pop(index)
+        self.player_currency += price
+        messagebox.showinfo("Card Sold", f"You sold {card} for {price} coins!")
+        self.market_menu()
+
+    @instrumented("get_card_price")
+    def get_card_price(self, card):
+        """Looks up the selling price of a card in the shared price table, as the main game does."""
+        try:
+            return card_price(parse_card_name(card))
+        except ValueError:
+            return 0  # Not a card the catalog knows, so it is worth nothing
+
+    def open_pack_animation(self, index):
+        """Animates the card pack opening with the correct animation based on the pack."""
+        pack_name = self.player_inventory.pop(index)  # Remove the pack from inventory
+        result = self.generate_card(pack_name)        # Generate the card based on the pack
+
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        # Get the correct animation image for the pack
+        pack_animation_image = self.pack_animation_image(pack_name)
+        
+        if pack_animation_image:
+            pack_img = tk.Label(self.root, image=pack_animation_image)
+            pack_img.pack(pady=20)
+            self.root.after(2000, lambda: self.reveal_card(result))
+        else:
+            self.reveal_card(result)
+
+    def reveal_card(self, card_obtained):
+        """Displays the obtained card after opening a pack."""
+        for widget in self.root.winfo_children():
+            widget.destroy()
+
+        self.update_currency_display()
+
+        tk.Label(self.root, text="You obtained:", font=("Helvetica", 18)).pack(pady=20)
+        tk.Label(self.root, text=card_obtained, font=("Helvetica", 16)).pack(pady=10)
+
+        tk.Button(self.root, text="Back to Inventory", width=20, command=self.inventory_menu).pack(pady=20)
+
+    @instrumented("generate_card")
+    def generate_card(self, pack_name):
+        """Generates a card from a given pack based on its rarity distribution or provides a refund."""
+        if random.random() <= REFUND_CHANCE:
+            refund_amount = CARD_PACKS[pack_name]["cost"] * 2
+            self.player_currency += refund_amount
+            return f"Refund! You received {refund_amount} Coins."
+
+        pack_info = CARD_PACKS[pack_name]
+        rarity_distribution = pack_info["rarity_distribution"]
+
+        rarities = list(rarity_distribution.keys())
+        probabilities = list(rarity_distribution.values())
+
+        selected_rarity = random.choices(rarities, probabilities, k=1)[0]
+
+        # Determine if the card is shiny, shadow, or cold variant
+        card_variant = ""
+        variant_roll = random.random()
+
+        if "cold" not in selected_rarity.lower():  # Cold cards from normal packs
+            if variant_roll <= SHADOW_CHANCE:
+                card_variant = "Shadow "
+            elif variant_roll <= SHINY_CHANCE + SHADOW_CHANCE:
+                card_variant = "Shiny "
+            elif variant_roll <= COLD_CHANCE + SHINY_CHANCE + SHADOW_CHANCE:
+                card_variant = "Cold "
+
+        # Cold packs always give a cold variant
+        if "cold" in selected_rarity.lower():
+            card_variant = ""  # Avoid adding "Cold" again
+
+        card_name = f"{card_variant}{selected_rarity.capitalize()} Card"
+
+        self.player_cards.append(card_name)
+        return card_name
+
+    def save_progress(self):
+        """Saves the current game progress."""
+        game = GameState(self.player_currency, self.player_snow,
+                         CountedInventory.from_save(self.player_inventory),
+                         CardCollection.from_names(self.player_cards),
+                         self.game.total_packs_opened, self.game.total_cards_sold,
+                         self.game.easter_eggs_found, self.game.experience_points)
+        # Every journal record up to the one replayed at startup is now in the snapshot
+        save_game(game.to_save(journal_seq=self.game.journal.seq))
+
+def main(started=None):
+    root = tk.Tk()
+    root.geometry("600x600")  # Set the window size
+    app = CardGameApp(root, StartupProfile(started))
+    root.mainloop()
+    if app.assets is not None:
+        app.assets.shutdown()
+    if METRICS.enabled and METRICS_FILE:
+        METRICS.dump(METRICS_FILE)
+
+if __name__ == "__main__":
+    main()
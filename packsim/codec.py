@@ -0,0 +1,151 @@
+"""Compact binary save format: a fixed header, varint-encoded numbers, then the names.
+
+Layout (little-endian):
+    header      magic, schema version, compression, payload length, length of the
+                numbers section, CRC-32 of the payload
+    payload     optionally zlib- or lzma-compressed:
+        numbers     LEB128 varints: the scalar fields (count first, zigzag-encoded so
+                    balances may go negative), the number of rarities, the number of
+                    packs and each pack's count, then the number of held card codes
+                    and a (gap, count) pair per code, where gap is the run of codes
+                    not held since the previous one
+        names       the rarity names in card-code order, then the pack names, as UTF-8
+                    separated by NUL bytes
+
+The schema version is the version of the save tuple (see packsim.saves), so
+a file written by an older game is decoded as it was written and then
+upgraded. Unlike pickle, decoding never runs code from the file.
+"""
+import lzma
+import struct
+import zlib
+
+MAGIC = b"PKSV"
+HEADER = struct.Struct("<4sHBIII")
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZMA = 2
+COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "lzma": COMPRESSION_LZMA}
+
+# Positions of the packs and cards in the save tuple; every other field is a scalar
+PACKS_FIELD = 2
+CARDS_FIELD = 3
+
+
+class SaveCodecError(ValueError):
+    """The file is not a binary save, or it is truncated or damaged."""
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(buffer):
+    """Decode a run of varints in one pass."""
+    values = []
+    append = values.append
+    value = shift = 0
+    for byte in buffer:
+        if byte < 0x80:
+            append(value | byte << shift)
+            value = shift = 0
+        else:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+    if shift:
+        raise SaveCodecError("The save is truncated.")
+    return values
+
+
+def encode_save(data, version, compression="none"):
+    """Encode a save tuple (with (rarities, {code: count}) cards) as bytes."""
+    rarities, cards = data[CARDS_FIELD]
+    packs = data[PACKS_FIELD]
+    names = list(rarities) + list(packs)
+    if any("\0" in name for name in names):
+        raise SaveCodecError("Rarity and pack names cannot contain NUL characters.")
+
+    out = bytearray()
+    scalars = [value for i, value in enumerate(data) if i not in (PACKS_FIELD, CARDS_FIELD)]
+    _write_varint(out, len(scalars))
+    for value in scalars:
+        _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+    _write_varint(out, len(rarities))
+    _write_varint(out, len(packs))
+    for count in packs.values():
+        _write_varint(out, count)
+    _write_varint(out, len(cards))
+    previous = -1
+    for code in sorted(cards):
+        _write_varint(out, code - previous - 1)
+        _write_varint(out, cards[code])
+        previous = code
+    numbers_length = len(out)
+    out += "\0".join(names).encode("utf-8")
+
+    payload = bytes(out)
+    method = COMPRESSIONS[compression]
+    if method == COMPRESSION_ZLIB:
+        payload = zlib.compress(payload, 9)
+    elif method == COMPRESSION_LZMA:
+        payload = lzma.compress(payload)
+    header = HEADER.pack(MAGIC, version, method, len(payload), numbers_length, zlib.crc32(payload))
+    return header + payload
+
+
+def is_binary_save(head):
+    """Whether the first bytes of a file are a binary save's."""
+    return head[:len(MAGIC)] == MAGIC
+
+
+def decode_save(buffer):
+    """Decode bytes from encode_save; returns (schema version, save tuple)."""
+    if len(buffer) < HEADER.size or not is_binary_save(buffer):
+        raise SaveCodecError("Not a binary save.")
+    _magic, version, method, length, numbers_length, crc = HEADER.unpack_from(buffer)
+    payload = bytes(buffer[HEADER.size:HEADER.size + length])
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise SaveCodecError("The save is truncated or damaged.")
+    try:
+        if method == COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+        elif method == COMPRESSION_LZMA:
+            payload = lzma.decompress(payload)
+        elif method != COMPRESSION_NONE:
+            raise SaveCodecError(f"Unknown compression {method}.")
+    except (zlib.error, lzma.LZMAError) as e:
+        raise SaveCodecError(f"The save is damaged: {e}") from None
+
+    numbers = _read_varints(payload[:numbers_length])
+    try:
+        names = payload[numbers_length:].decode("utf-8").split("\0")
+    except UnicodeDecodeError as e:
+        raise SaveCodecError(f"The save is damaged: {e}") from None
+    try:
+        n_scalars = numbers[0]
+        scalars = [value >> 1 ^ -(value & 1) for value in numbers[1:n_scalars + 1]]
+        pos = n_scalars + 1
+        n_rarities, n_packs = numbers[pos], numbers[pos + 1]
+        pos += 2
+        rarities = tuple(names[:n_rarities])
+        packs = dict(zip(names[n_rarities:n_rarities + n_packs], numbers[pos:pos + n_packs]))
+        pos += n_packs
+        n_cards = numbers[pos]
+        pairs = numbers[pos + 1:pos + 1 + 2 * n_cards]
+    except IndexError:
+        raise SaveCodecError("The save is truncated.") from None
+    if len(pairs) != 2 * n_cards or len(packs) != n_packs or len(rarities) != n_rarities:
+        raise SaveCodecError("The save is truncated.")
+
+    cards = {}
+    code = -1
+    for gap, count in zip(pairs[::2], pairs[1::2]):
+        code += gap + 1
+        cards[code] = count
+
+    data = scalars[:PACKS_FIELD] + [packs, (rarities, cards)] + scalars[PACKS_FIELD:]
+    return version, tuple(data)
@@ -0,0 +1,96 @@
+"""Memory-mapped save format: a small header plus fixed-width integer columns.
+
+Layout (little-endian):
+    header      magic, version, rarity count, balances, stats, journal sequence
+    rarities    one length-prefixed UTF-8 name per rarity, in card-code order
+    packs       pack count, then a length-prefixed name and u64 count per pack
+    padding     up to an 8-byte boundary
+    cards       one u64 count per card code
+
+Loading maps the file and uses the card column in place (copy-on-write), so
+nothing is decoded per card and only the pages that are touched are read.
+"""
+import mmap
+import struct
+
+from packsim.cards import RARITIES, VARIANT_BITS, CardCollection
+from packsim.journal import write_atomic
+
+MAGIC = b"PKSC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHqqqqqqqq")
+_LENGTH = struct.Struct("<H")
+_COUNT = struct.Struct("<Q")
+
+
+def _pack_name(name):
+    encoded = name.encode("utf-8")
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_name(buffer, offset):
+    (length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    return bytes(buffer[offset:offset + length]).decode("utf-8"), offset + length
+
+
+def save_columnar(data, filename):
+    """Write a save tuple (as built by save_progress) in the columnar format."""
+    (coins, snow, packs, cards, net_worth, total_packs_opened, total_cards_sold,
+     easter_eggs_found, experience_points, journal_seq) = data
+    rarities, card_counts = cards
+
+    parts = [HEADER.pack(MAGIC, VERSION, len(rarities), coins, snow, net_worth,
+                         total_packs_opened, total_cards_sold, easter_eggs_found,
+                         experience_points, journal_seq)]
+    parts.extend(_pack_name(rarity) for rarity in rarities)
+    parts.append(_COUNT.pack(len(packs)))
+    for pack_name, count in packs.items():
+        parts.append(_pack_name(pack_name) + _COUNT.pack(count))
+
+    used = sum(map(len, parts))
+    parts.append(bytes(-used % 8))
+
+    column = [0] * (len(rarities) << VARIANT_BITS)
+    for code, count in card_counts.items():
+        column[code] = count
+    parts.append(struct.pack(f"<{len(column)}Q", *column))
+    write_atomic(filename, b"".join(parts))
+
+
+def load_columnar(filename):
+    """Map a columnar save and return a save tuple whose cards are already a CardCollection."""
+    with open(filename, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+
+    (magic, version, n_rarities, coins, snow, net_worth, total_packs_opened,
+     total_cards_sold, easter_eggs_found, experience_points, journal_seq) = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{filename} is not a version {VERSION} columnar save")
+
+    offset = HEADER.size
+    rarities = []
+    for _ in range(n_rarities):
+        rarity, offset = _unpack_name(view, offset)
+        rarities.append(rarity)
+
+    (n_packs,) = _COUNT.unpack_from(view, offset)
+    offset += _COUNT.size
+    packs = {}
+    for _ in range(n_packs):
+        pack_name, offset = _unpack_name(view, offset)
+        (packs[pack_name],) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+
+    offset += -offset % 8
+    column = view[offset:offset + (n_rarities << VARIANT_BITS) * 8].cast("Q")
+    if tuple(rarities) == RARITIES and struct.pack("=Q", 1) == struct.pack("<Q", 1):
+        cards = CardCollection.from_counts(column)
+    else:
+        # Rarities changed (or a big-endian host): fall back to remapping the counts
+        cards = CardCollection.from_save((rarities, {code: count for code, count in enumerate(column) if count}))
+
+    view.release()  # The card column keeps the mapping alive on its own
+    return (coins, snow, packs, cards, net_worth, total_packs_opened, total_cards_sold,
+            easter_eggs_found, experience_points, journal_seq)
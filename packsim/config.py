@@ -0,0 +1,19 @@
+"""Pack catalog and drop-rate constants shared by the game and the headless tools.
+
+The values live in catalog.json (see packsim.catalog); edit that file to add
+packs or change rates. Everything here is read-only.
+"""
+from packsim.catalog import CATALOG
+
+# Card packs, including the Easter Egg packs (the ones with "purchasable": false)
+CARD_PACKS = CATALOG.card_packs
+
+# Chances for shiny, shadow, and cold cards
+SHINY_CHANCE = CATALOG.chances["shiny"]
+SHADOW_CHANCE = CATALOG.chances["shadow"]
+COLD_CHANCE = CATALOG.chances["cold"]  # Only rolled for cards from normal packs
+REFUND_CHANCE = CATALOG.chances["refund"]  # Chance to get twice the money you spent back
+
+# Easter Egg Chance
+EASTER_EGG_CHANCE = CATALOG.chances["easter_egg"]
+EASTER_EGG_OPTIONS = CATALOG.easter_egg_options
@@ -0,0 +1,413 @@
+"""Game rules with no Tk dependency; the GUI, scripts, tests and benchmarks all drive a GameState."""
+import logging
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # the game runs without NumPy, only large batches open more slowly
+    np = None
+
+from packsim.cards import (
+    RARITY_IDS, VARIANT_BITS, VARIANT_NONE, VARIANT_SHADOW, VARIANT_SHINY, VARIANT_COLD,
+    CardCollection, card_code, card_name,
+)
+from packsim.config import (
+    CARD_PACKS, SHINY_CHANCE, SHADOW_CHANCE, COLD_CHANCE, REFUND_CHANCE, EASTER_EGG_CHANCE,
+)
+from packsim.instrument import METRICS, instrumented
+from packsim.inventory import CountedInventory
+from packsim.journal import apply_event, capture, diff
+from packsim.ledger import Ledger
+from packsim.pricing import card_price
+from packsim.rng import RngService
+from packsim.samplers import SAMPLERS
+
+# Economy
+STARTING_COINS = 180
+COINS_PER_SNOW = 250
+COIN_REWARD = 20  # Awarded every 2 minutes while the game is open
+MILLION_COINS = 1_000_000
+
+# Experience points per action
+XP_BUY_PACK = 10
+XP_SELL_CARD = 15
+XP_CONVERT = 5
+XP_REFUND = 5
+XP_EASTER_EGG = 100
+XP_MILLION_COINS = 1000
+
+# open_packs rolls batches at least this big all at once with packsim.batch (needs NumPy)
+BATCH_OPEN_MIN = 64
+
+# What opening a pack produced
+OUTCOME_CARD = 0
+OUTCOME_REFUND = 1
+OUTCOME_EASTER_EGG = 2
+
+_NO_JOURNAL = nullcontext()
+
+log = logging.getLogger(__name__)
+
+
+class GameError(Exception):
+    """An action the rules do not allow, e.g. buying without enough currency."""
+
+
+class OpenResult(NamedTuple):
+    """The result of opening one pack."""
+
+    pack_name: str
+    outcome: int
+    card: int = -1        # Card code, for OUTCOME_CARD
+    coins: int = 0        # Coins received, for refunds and the Million Coins egg
+    easter_egg: str = ""  # Easter egg option, for OUTCOME_EASTER_EGG
+
+    @property
+    def message(self):
+        """The text shown to the player when the pack is revealed."""
+        if self.outcome == OUTCOME_REFUND:
+            return f"Refund! You received {self.coins} Coins."
+        if self.outcome == OUTCOME_EASTER_EGG:
+            if self.easter_egg == "Million Coins":
+                return "Easter Egg! You received 1 Million Coins!"
+            return f"Easter Egg! You found a hidden {self.easter_egg}!"
+        return card_name(self.card)
+
+
+class OpenSummary:
+    """The combined results of opening many packs of one type."""
+
+    def __init__(self, pack_name):
+        self.pack_name = pack_name
+        self.opened = 0
+        self.cards = Counter()        # Card code -> count
+        self.refunds = 0
+        self.coins = 0                # From refunds and the Million Coins egg
+        self.easter_eggs = Counter()  # Easter egg option -> count
+
+    def add(self, result):
+        self.opened += 1
+        self.coins += result.coins
+        if result.outcome == OUTCOME_CARD:
+            self.cards[result.card] += 1
+        elif result.outcome == OUTCOME_REFUND:
+            self.refunds += 1
+        else:
+            self.easter_eggs[result.easter_egg] += 1
+
+    def lines(self):
+        """The text shown to the player, one line per kind of result."""
+        lines = [f"Opened {self.opened} {self.pack_name}(s)"]
+        if self.refunds:
+            lines.append(f"Refunds: {self.refunds}")
+        if self.coins:
+            lines.append(f"Coins received: {self.coins}")
+        lines.extend(f"Easter Egg! {option} x{count}" for option, count in self.easter_eggs.most_common())
+        lines.extend(f"{card_name(code)} x{count}" for code, count in sorted(self.cards.items()))
+        return lines
+
+
+class GameState:
+    """Balances, packs, cards and stats, plus every action a player can take.
+
+    Actions raise GameError instead of showing dialogs. rng is an RngService (a
+    freshly seeded one by default) or anything with a random() method, such as
+    the random module. When a journal is attached each action is recorded as one
+    journal event; when a replay_log is set each action is logged with its arguments.
+    """
+
+    def __init__(self, coins=STARTING_COINS, snow=0, packs=None, cards=None,
+                 total_packs_opened=0, total_cards_sold=0, easter_eggs_found=0,
+                 experience_points=0, rng=None, verify=False):
+        self.ledger = Ledger(coins, snow, cards, verify=verify)
+        self.packs = packs if packs is not None else CountedInventory()
+        self.total_packs_opened = total_packs_opened
+        self.total_cards_sold = total_cards_sold
+        self.easter_eggs_found = easter_eggs_found
+        self.experience_points = experience_points
+        if rng is None:
+            rng = RngService()
+        # The hot path draws straight from the Random; the service is kept for seeds and splitting
+        self.rng_service = rng if isinstance(rng, RngService) else None
+        self.rng = rng.random if self.rng_service is not None else rng
+        self.journal = None
+        self.replay_log = None
+
+    @property
+    def coins(self):
+        return self.ledger.coins
+
+    @property
+    def snow(self):
+        return self.ledger.snow
+
+    @property
+    def cards(self):
+        return self.ledger.cards
+
+    @property
+    def net_worth(self):
+        """Total coins plus the sell price of all cards."""
+        return self.ledger.net_worth
+
+    # Persistence
+
+    def to_save(self, journal_seq=None):
+        """Return the save tuple written by save_game."""
+        if journal_seq is None:
+            journal_seq = self.journal.seq if self.journal is not None else 0
+        return (self.ledger.coins, self.ledger.snow, self.packs.to_save(), self.cards.to_save(),
+                self.net_worth, self.total_packs_opened, self.total_cards_sold,
+                self.easter_eggs_found, self.experience_points, journal_seq)
+
+    @classmethod
+    def from_save(cls, data, **kwargs):
+        """Build a game from a save tuple, converting string-based saves to counts.
+
+        Net worth is recomputed by the ledger rather than trusted from the file.
+        """
+        (coins, snow, packs, cards, _saved_net_worth, total_packs_opened, total_cards_sold,
+         easter_eggs_found, experience_points, _journal_seq) = data
+        return cls(coins, snow, CountedInventory.from_save(packs), CardCollection.from_save(cards),
+                   total_packs_opened, total_cards_sold, easter_eggs_found, experience_points, **kwargs)
+
+    def attach_journal(self, journal, after_seq=0):
+        """Replay the journal records newer than after_seq, then record new actions to it."""
+        for event in journal.read(after_seq=after_seq):
+            apply_event(self, event)
+        self.journal = journal
+
+    def journaled(self, event):
+        """Context manager recording everything the wrapped action changes as one event."""
+        if self.journal is None:
+            return _NO_JOURNAL
+        return self._journaled(event)
+
+    @contextmanager
+    def _journaled(self, event):
+        before = capture(self)
+        try:
+            yield
+        finally:
+            self.journal.record(event, diff(before, capture(self)))
+
+    def _log(self, action, *args):
+        if self.replay_log is not None:
+            self.replay_log.record(action, *args)
+
+    # Actions
+
+    def add_experience(self, points):
+        self.experience_points += points
+
+    def buy_pack(self, pack_name, quantity=1):
+        """Pay for quantity packs and add them to the inventory."""
+        pack_info = CARD_PACKS[pack_name]
+        total_cost = pack_info["cost"] * quantity
+        ledger = self.ledger
+        self._log("buy_pack", pack_name, quantity)
+
+        with self.journaled("buy"):
+            if pack_info["currency"] == "coins":
+                if ledger.coins < total_cost:
+                    raise GameError("Not enough currency!")
+                ledger.coins -= total_cost
+            elif pack_info["currency"] == "snow":
+                if ledger.snow < total_cost:
+                    raise GameError("Not enough Snow!")
+                ledger.snow -= total_cost
+            else:
+                raise GameError(f"{pack_name} cannot be bought.")
+            self.add_experience(XP_BUY_PACK * quantity)
+            self.packs.add(pack_name, quantity)
+            self.total_packs_opened += quantity  # Counted when bought, as it always has been
+        METRICS.count("packs bought", quantity)
+        log.debug("Bought %d %s(s) for %d %s", quantity, pack_name, total_cost, pack_info["currency"])
+
+    def open_pack(self, pack_name):
+        """Take one pack out of the inventory and open it."""
+        self._log("open_pack", pack_name)
+        with self.journaled("open"):
+            try:
+                self.packs.remove(pack_name)
+            except ValueError:
+                raise GameError(f"No {pack_name} in inventory.") from None
+            result = self.generate_card(pack_name)
+        METRICS.count("packs opened")
+        log.debug("Opened %s: %s", pack_name, result)
+        return result
+
+    def open_packs(self, pack_name, quantity=None):
+        """Open quantity packs of one type (every one held if None) as a single journal event.
+
+        Returns an OpenSummary. Easter egg packs found go to the inventory, as with open_pack.
+        With NumPy and an RngService, batches of BATCH_OPEN_MIN or more are rolled
+        all at once, which opens millions of packs a second.
+        """
+        self._log("open_packs", pack_name, quantity)
+        held = self.packs.count(pack_name)
+        if quantity is None:
+            quantity = held
+        if quantity < 1 or quantity > held:
+            raise GameError(f"No {pack_name} in inventory." if not held else f"You only have {held} {pack_name}(s).")
+
+        summary = OpenSummary(pack_name)
+        with self.journaled("open"):
+            self.packs.remove(pack_name, quantity)
+            if np is not None and self.rng_service is not None and quantity >= BATCH_OPEN_MIN:
+                self._open_batch(pack_name, quantity, summary)
+            else:
+                for _ in range(quantity):
+                    summary.add(self.generate_card(pack_name))
+        METRICS.count("packs opened", quantity)
+        log.debug("Opened %d %s(s) at once", quantity, pack_name)
+        return summary
+
+    def _open_batch(self, pack_name, quantity, summary):
+        """Roll quantity packs with packsim.batch and apply the results a kind of result at a time."""
+        from packsim.batch import open_packs as roll_packs  # batch imports this module
+
+        results = roll_packs(pack_name, quantity, self.rng_service)
+        outcome = results["outcome"]
+        summary.opened += quantity
+
+        refunds = int(np.count_nonzero(outcome == OUTCOME_REFUND))
+        if refunds:
+            refund_amount = CARD_PACKS[pack_name]["cost"] * 2 * refunds
+            self.ledger.coins += refund_amount
+            self.add_experience(XP_REFUND * refunds)
+            summary.refunds += refunds
+            summary.coins += refund_amount
+
+        options = SAMPLERS.easter_egg().outcomes
+        eggs, egg_counts = np.unique(results["egg"][outcome == OUTCOME_EASTER_EGG], return_counts=True)
+        for egg, count in zip(eggs.tolist(), egg_counts.tolist()):
+            easter_egg_choice = options[egg]
+            self.easter_eggs_found += count
+            summary.easter_eggs[easter_egg_choice] += count
+            if easter_egg_choice == "Million Coins":
+                self.ledger.coins += MILLION_COINS * count
+                self.add_experience(XP_MILLION_COINS * count)
+                summary.coins += MILLION_COINS * count
+            else:
+                self.packs.add(easter_egg_choice, count)
+                self.add_experience(XP_EASTER_EGG * count)
+
+        cards = results[outcome == OUTCOME_CARD]
+        codes = cards["rarity"].astype(np.intp) << VARIANT_BITS | cards["variant"]
+        codes, card_counts = np.unique(codes, return_counts=True)
+        for code, count in zip(codes.tolist(), card_counts.tolist()):
+            self.ledger.add_card(code, count)
+            summary.cards[code] += count
+
+    @instrumented("generate_card")
+    def generate_card(self, pack_name):
+        """Roll a pack's contents and apply them: a refund, an Easter egg, or a card."""
+        rng = self.rng
+        if rng.random() <= REFUND_CHANCE:
+            refund_amount = CARD_PACKS[pack_name]["cost"] * 2
+            self.ledger.coins += refund_amount
+            self.add_experience(XP_REFUND)
+            return OpenResult(pack_name, OUTCOME_REFUND, coins=refund_amount)
+
+        # Easter Egg logic: 0.5% chance to trigger an Easter Egg
+        if rng.random() <= EASTER_EGG_CHANCE:
+            easter_egg_choice = SAMPLERS.easter_egg().draw(rng)
+            self.easter_eggs_found += 1
+            if easter_egg_choice == "Million Coins":
+                self.ledger.coins += MILLION_COINS
+                self.add_experience(XP_MILLION_COINS)
+                return OpenResult(pack_name, OUTCOME_EASTER_EGG, coins=MILLION_COINS,
+                                  easter_egg=easter_egg_choice)
+            self.packs.add(easter_egg_choice)
+            self.add_experience(XP_EASTER_EGG)
+            return OpenResult(pack_name, OUTCOME_EASTER_EGG, easter_egg=easter_egg_choice)
+
+        # Normal card generation logic based on pack's rarity distribution
+        selected_rarity = SAMPLERS.pack(pack_name).draw(rng)
+
+        # Cold packs already give cold cards, so they never roll a variant
+        card_variant = VARIANT_NONE
+        variant_roll = rng.random()
+        if "cold" not in selected_rarity.lower():
+            if variant_roll <= SHADOW_CHANCE:
+                card_variant = VARIANT_SHADOW
+            elif variant_roll <= SHINY_CHANCE + SHADOW_CHANCE:
+                card_variant = VARIANT_SHINY
+            elif variant_roll <= COLD_CHANCE + SHINY_CHANCE + SHADOW_CHANCE:
+                card_variant = VARIANT_COLD
+
+        card = card_code(RARITY_IDS[selected_rarity], card_variant)
+        self.ledger.add_card(card)
+        return OpenResult(pack_name, OUTCOME_CARD, card=card)
+
+    def sell_card(self, code):
+        """Sell one card of a type and return the price received."""
+        price = card_price(code)
+        self._log("sell_card", code)
+        with self.journaled("sell"):
+            try:
+                self.ledger.remove_code(code)
+            except ValueError:
+                raise GameError(f"No {card_name(code)} to sell.") from None
+            self.ledger.coins += price
+            self.total_cards_sold += 1
+            self.add_experience(XP_SELL_CARD)
+        METRICS.count("cards sold")
+        return price
+
+    def matching_cards(self, text):
+        """Return the codes of held cards whose name contains text, ignoring case."""
+        text = text.lower().strip()
+        return [code for code, _count in self.cards.groups() if text in card_name(code).lower()]
+
+    def sell_all(self, codes):
+        """Sell every held card of the given codes as a single journal event.
+
+        Returns (cards sold, coins received).
+        """
+        codes = tuple(codes)
+        self._log("sell_all", codes)
+        counts = self.cards.counts
+        sold = coins = 0
+        with self.journaled("sell"):
+            for code in codes:
+                quantity = counts[code]
+                if quantity:
+                    self.ledger.remove_code(code, quantity)
+                    sold += quantity
+                    coins += card_price(code) * quantity
+            self.ledger.coins += coins
+            self.total_cards_sold += sold
+            self.add_experience(XP_SELL_CARD * sold)
+        METRICS.count("cards sold", sold)
+        log.debug("Sold %d card(s) of %d type(s) for %d coins", sold, len(codes), coins)
+        return sold, coins
+
+    def convert_coins_to_snow(self):
+        """Converts COINS_PER_SNOW Coins to 1 Snow."""
+        self._log("convert_coins_to_snow")
+        if self.ledger.coins < COINS_PER_SNOW:
+            raise GameError("Not enough coins to convert!")
+        with self.journaled("convert"):
+            self.ledger.coins -= COINS_PER_SNOW
+            self.ledger.snow += 1
+            self.add_experience(XP_CONVERT)
+
+    def convert_snow_to_coins(self):
+        """Converts 1 Snow to COINS_PER_SNOW Coins."""
+        self._log("convert_snow_to_coins")
+        if self.ledger.snow < 1:
+            raise GameError("Not enough Snow to convert!")
+        with self.journaled("convert"):
+            self.ledger.snow -= 1
+            self.ledger.coins += COINS_PER_SNOW
+            self.add_experience(XP_CONVERT)
+
+    def coin_reward(self):
+        """The periodic reward for keeping the game open."""
+        self._log("coin_reward")
+        with self.journaled("coin_reward"):
+            self.ledger.coins += COIN_REWARD
@@ -0,0 +1,177 @@
+"""Counters, timing histograms and logging setup, free when switched off.
+
+Metrics are switched on with PACKSIM_METRICS=1 before the game starts. When
+they are off, instrumented() hands back the undecorated function, so hot
+paths such as generate_card and card_price run exactly as before.
+
+    PACKSIM_METRICS=1          collect counters and timings (Stats > Diagnostics shows them)
+    PACKSIM_METRICS_FILE=path  also write them as JSON when the game closes
+    PACKSIM_LOG_LEVEL=DEBUG    log level for the "packsim" loggers (default WARNING)
+    PACKSIM_LOG_FILE=path      write the log there instead of stderr
+
+Modules log through logging.getLogger(__name__) with %-style arguments, so a
+message is only formatted if its level is enabled.
+"""
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from packsim.journal import write_atomic
+
+METRICS_ENABLED = bool(os.environ.get("PACKSIM_METRICS"))
+METRICS_FILE = os.environ.get("PACKSIM_METRICS_FILE")
+
+# Timing buckets double in width: bucket i holds durations below 2**i microseconds
+TIMING_BUCKETS = 32
+
+
+class Timing:
+    """A histogram of durations with power-of-two microsecond buckets."""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * TIMING_BUCKETS
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        micros = int(seconds * 1e6)
+        self.buckets[min(micros.bit_length(), TIMING_BUCKETS - 1)] += 1
+
+    def percentile(self, p):
+        """Return the upper edge (in seconds) of the bucket holding the p-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min((1 << i) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "min_s": self.min if self.count else 0.0,
+            "max_s": self.max,
+            "p50_s": self.percentile(50),
+            "p95_s": self.percentile(95),
+            "buckets_us_pow2": self.buckets,
+        }
+
+
+class Metrics:
+    """Named counters and Timing histograms."""
+
+    def __init__(self, enabled=METRICS_ENABLED):
+        self.enabled = enabled
+        self.counters = {}
+        self.timings = {}
+        self.started = time.time()
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def timing(self, name):
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing()
+        return timing
+
+    @contextmanager
+    def timed(self, name):
+        """Time the wrapped block into the named histogram (if metrics are on)."""
+        if not self.enabled:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timing(name).add(time.perf_counter() - begin)
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+        self.started = time.time()
+
+    def snapshot(self):
+        """Return every counter and timing as plain, JSON-ready data."""
+        return {
+            "started": self.started,
+            "counters": dict(self.counters),
+            "timings": {name: timing.to_dict() for name, timing in self.timings.items()},
+        }
+
+    def report_lines(self):
+        """Human-readable lines for the diagnostics panel."""
+        if not self.enabled:
+            return ["Metrics are off. Start the game with PACKSIM_METRICS=1 to collect them."]
+        lines = []
+        for name in sorted(self.timings):
+            t = self.timings[name]
+            if not t.count:
+                continue
+            lines.append(f"{name}: {t.count} calls, mean {t.total / t.count * 1e3:.3f} ms, "
+                         f"p95 < {t.percentile(95) * 1e3:.3f} ms, max {t.max * 1e3:.3f} ms")
+        for name in sorted(self.counters):
+            lines.append(f"{name}: {self.counters[name]}")
+        return lines or ["Nothing measured yet."]
+
+    def dump(self, filename):
+        """Write snapshot() to a JSON file."""
+        write_atomic(filename, json.dumps(self.snapshot(), indent=2).encode())
+
+
+METRICS = Metrics()
+
+
+def instrumented(name, metrics=METRICS):
+    """Decorator counting calls and timing them into the named histogram.
+
+    With metrics off the function itself is returned, so there is no overhead.
+    """
+    def decorate(func):
+        if not metrics.enabled:
+            return func
+
+        timing = metrics.timing(name)
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            begin = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timing.add(perf_counter() - begin)
+
+        return wrapper
+    return decorate
+
+
+def configure_logging():
+    """Set up the "packsim" loggers from PACKSIM_LOG_LEVEL and PACKSIM_LOG_FILE."""
+    level = os.environ.get("PACKSIM_LOG_LEVEL", "WARNING").upper()
+    filename = os.environ.get("PACKSIM_LOG_FILE")
+    handler = logging.FileHandler(filename) if filename else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger = logging.getLogger("packsim")
+    logger.setLevel(getattr(logging, level, logging.WARNING))
+    logger.addHandler(handler)
+    return logger
@@ -0,0 +1,94 @@
+"""Multiset storage for packs: a count per pack type instead of one string per pack."""
+
+
+class CountedInventory:
+    """Counts of items by key, in the order each key was first added.
+
+    add/remove/count are O(1). The list-style methods (indexing, pop, append,
+    extend, iteration) are kept for screens that still address packs by
+    position; positions walk the groups in order, so they cost O(number of keys).
+    """
+
+    def __init__(self, items=()):
+        self.counts = {}
+        self._size = 0
+        self.extend(items)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __contains__(self, key):
+        return key in self.counts
+
+    def count(self, key):
+        return self.counts.get(key, 0)
+
+    def add(self, key, quantity=1):
+        """Add quantity copies of key."""
+        if quantity < 0:
+            raise ValueError(f"Cannot add a negative quantity of {key!r}")
+        if quantity:
+            self.counts[key] = self.counts.get(key, 0) + quantity
+            self._size += quantity
+
+    def remove(self, key, quantity=1):
+        """Remove quantity copies of key, raising ValueError if there are not enough."""
+        have = self.counts.get(key, 0)
+        if quantity > have:
+            raise ValueError(f"Only {have} of {key!r} in inventory, cannot remove {quantity}")
+        if quantity == have:
+            self.counts.pop(key, None)
+        else:
+            self.counts[key] = have - quantity
+        self._size -= quantity
+
+    def groups(self):
+        """Return (key, count) pairs for every key held."""
+        return list(self.counts.items())
+
+    # List-style compatibility layer
+
+    def append(self, key):
+        self.add(key)
+
+    def extend(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def __iter__(self):
+        for key, count in list(self.counts.items()):
+            for _ in range(count):
+                yield key
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("inventory index out of range")
+        for key, count in self.counts.items():
+            if index < count:
+                return key
+            index -= count
+
+    def pop(self, index=-1):
+        """Remove and return the item at a list position."""
+        key = self[index]
+        self.remove(key)
+        return key
+
+    def to_save(self):
+        return dict(self.counts)
+
+    @classmethod
+    def from_save(cls, data):
+        """Load what to_save produced, or the flat list of names kept by older saves."""
+        inventory = cls()
+        if isinstance(data, dict):
+            for key, count in data.items():
+                inventory.add(key, count)
+        else:
+            inventory.extend(data)
+        return inventory
@@ -0,0 +1,189 @@
+"""Append-only save journal: small event records between occasional full snapshots.
+
+The snapshot is the regular save file, written to a temporary file and renamed
+over the old one so a crash never leaves half a save behind. Every change made
+after it is appended to the journal as one JSON line holding the deltas of that
+action (coins, Snow, packs, cards, stats). Each record carries a sequence number
+and the snapshot remembers the last one it includes, so loading is "read the
+snapshot, replay the newer records" even if the game died between writing a
+snapshot and clearing the journal.
+"""
+import json
+import logging
+import os
+from array import array
+
+from packsim.cards import CardCollection, card_name, parse_card_name
+
+log = logging.getLogger(__name__)
+
+# Counters kept on a GameState next to its ledger and packs
+STAT_FIELDS = ("total_packs_opened", "total_cards_sold", "easter_eggs_found", "experience_points")
+
+
+def write_atomic(filename, payload):
+    """Write bytes to filename via a temporary file and an atomic rename."""
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+
+def capture(game):
+    """Copy the parts of a GameState that events describe; cheap, it is counts not cards."""
+    return (
+        game.ledger.coins,
+        game.ledger.snow,
+        dict(game.packs.counts),
+        array(CardCollection.TYPECODE, game.ledger.cards.counts),
+        tuple(getattr(game, field) for field in STAT_FIELDS),
+    )
+
+
+def diff(before, after):
+    """Return the deltas that turn one capture into another, leaving out anything unchanged."""
+    deltas = {}
+    coins = after[0] - before[0]
+    if coins:
+        deltas["coins"] = coins
+    snow = after[1] - before[1]
+    if snow:
+        deltas["snow"] = snow
+
+    packs = {}
+    for pack in before[2].keys() | after[2].keys():
+        change = after[2].get(pack, 0) - before[2].get(pack, 0)
+        if change:
+            packs[pack] = change
+    if packs:
+        deltas["packs"] = packs
+
+    cards = {
+        card_name(code): new - old
+        for code, (old, new) in enumerate(zip(before[3], after[3]))
+        if new != old
+    }
+    if cards:
+        deltas["cards"] = cards
+
+    stats = {
+        field: new - old
+        for field, old, new in zip(STAT_FIELDS, before[4], after[4])
+        if new != old
+    }
+    if stats:
+        deltas["stats"] = stats
+    return deltas
+
+
+def apply_event(game, event):
+    """Replay one journal record onto a GameState."""
+    ledger = game.ledger
+    ledger.coins += event.get("coins", 0)
+    ledger.snow += event.get("snow", 0)
+    for pack, change in event.get("packs", {}).items():
+        if change > 0:
+            game.packs.add(pack, change)
+        else:
+            game.packs.remove(pack, -change)
+    for name, change in event.get("cards", {}).items():
+        code = parse_card_name(name)
+        if change > 0:
+            ledger.add_card(code, change)
+        else:
+            ledger.remove_code(code, -change)
+    for field, change in event.get("stats", {}).items():
+        setattr(game, field, getattr(game, field) + change)
+
+
+class Journal:
+    """Buffers event records in memory and appends them to a file on flush."""
+
+    def __init__(self, filename="savegame.journal"):
+        self.filename = filename
+        self.seq = 0              # Sequence number of the newest record
+        self.snapshot_seq = 0     # Newest record already folded into the snapshot
+        self._pending = []
+
+    @property
+    def events_since_snapshot(self):
+        return self.seq - self.snapshot_seq
+
+    @property
+    def dirty(self):
+        return bool(self._pending)
+
+    def record(self, event, deltas):
+        """Queue one record; does nothing if the action changed nothing."""
+        if not deltas:
+            return
+        self.seq += 1
+        self._pending.append({"seq": self.seq, "event": event, **deltas})
+
+    def take(self):
+        """Remove the queued records and return them as journal lines for append()."""
+        lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in self._pending)
+        self._pending.clear()
+        return lines
+
+    def append(self, lines):
+        """Append lines from take() to the journal file and fsync it.
+
+        Only does file I/O, so it may run on another thread than the one recording events.
+        """
+        if not lines:
+            return
+        with open(self.filename, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        log.debug("Appended %d journal record(s) to %s", lines.count("\n"), self.filename)
+
+    def flush(self):
+        """Append queued records to the journal file and fsync it."""
+        self.append(self.take())
+
+    def read(self, after_seq):
+        """Return the records newer than after_seq and continue numbering from them.
+
+        A torn last line from a crash mid-write is cut off so later appends start clean.
+        """
+        self.seq = self.snapshot_seq = after_seq
+        records = []
+        try:
+            f = open(self.filename, "r+", encoding="utf-8")
+        except FileNotFoundError:
+            return records
+        with f:
+            good_end = 0
+            for line in iter(f.readline, ""):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith("\n"):
+                    break
+                good_end = f.tell()
+                if record["seq"] > after_seq:
+                    records.append(record)
+                    self.seq = record["seq"]
+            f.truncate(good_end)
+        return records
+
+    def mark_snapshot(self):
+        """Drop the queued records: a snapshot taken now holds every record up to self.seq."""
+        self._pending.clear()
+        self.snapshot_seq = self.seq
+
+    def truncate(self):
+        """Empty the journal file once the snapshot from mark_snapshot() is on disk."""
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def snapshot_written(self):
+        """Clear the journal once a snapshot holding every record up to self.seq is on disk."""
+        self.mark_snapshot()
+        self.truncate()
@@ -0,0 +1,71 @@
+"""Balances and collection totals that are updated on every change instead of recounted."""
+from packsim.cards import (
+    RARITIES, VARIANT_PREFIXES, CardCollection, card_rarity, card_variant,
+)
+from packsim.pricing import PRICE_TABLE, total_price
+
+
+class LedgerMismatch(AssertionError):
+    """Raised in verify mode when the running totals disagree with a full recount."""
+
+
+class Ledger:
+    """Coin and Snow balances plus running per-rarity/per-variant counts and card value.
+
+    Cards must be added and removed through the ledger so the aggregates stay in
+    step; with verify=True every card change is checked against a full recount.
+    """
+
+    def __init__(self, coins=0, snow=0, cards=None, verify=False):
+        self.coins = coins
+        self.snow = snow
+        self.verify = verify
+        self.set_cards(cards if cards is not None else CardCollection())
+
+    @property
+    def net_worth(self):
+        """Coins plus the sell value of every card."""
+        return self.coins + self.card_value
+
+    @property
+    def card_count(self):
+        return len(self.cards)
+
+    def set_cards(self, cards):
+        """Replace the whole collection and recount from scratch."""
+        self.cards = cards
+        self.rarity_counts, self.variant_counts, self.card_value = self._recount()
+
+    def add_card(self, code, quantity=1):
+        """Add quantity cards of one code to the collection."""
+        self.cards.add(code, quantity)
+        self._count(code, quantity)
+        if self.verify:
+            self.check()
+
+    def remove_code(self, code, quantity=1):
+        """Remove quantity cards of one code."""
+        self.cards.remove(code, quantity)
+        self._count(code, -quantity)
+        if self.verify:
+            self.check()
+
+    def _count(self, code, delta):
+        self.rarity_counts[card_rarity(code)] += delta
+        self.variant_counts[card_variant(code)] += delta
+        self.card_value += PRICE_TABLE[code] * delta
+
+    def _recount(self):
+        rarity_counts = [0] * len(RARITIES)
+        variant_counts = [0] * len(VARIANT_PREFIXES)
+        for code, count in self.cards.groups():
+            rarity_counts[card_rarity(code)] += count
+            variant_counts[card_variant(code)] += count
+        return rarity_counts, variant_counts, total_price(self.cards)
+
+    def check(self):
+        """Recount the collection and raise LedgerMismatch if the running totals drifted."""
+        expected = self._recount()
+        actual = (self.rarity_counts, self.variant_counts, self.card_value)
+        if expected != actual:
+            raise LedgerMismatch(f"Ledger totals {actual!r} differ from a recount {expected!r}")
@@ -0,0 +1,230 @@
+"""Exact pack odds and expected values, worked out from the config instead of simulated.
+
+Opening a pack is a refund roll, then an Easter egg roll, then a rarity and a
+variant, so every outcome's probability is a product of config values. An
+Easter egg pack is opened too, which makes a pack's value depend on the value
+of the egg packs; that small linear system is solved by iteration.
+
+    python -m packsim.odds                  # EV and spread of every pack
+    python -m packsim.odds --check 200000   # compare against packsim.simulate
+"""
+import argparse
+import sys
+from typing import NamedTuple
+
+from packsim import config, pricing
+from packsim.cards import (
+    RARITY_IDS, VARIANT_NONE, VARIANT_SHADOW, VARIANT_SHINY, VARIANT_COLD,
+    card_code, card_name,
+)
+from packsim.game import MILLION_COINS
+
+REFUND = "Refund"
+MILLION_COINS_EGG = "Million Coins"
+
+
+class PackOdds(NamedTuple):
+    """Everything one opening of a pack can produce, and what it is worth sold.
+
+    outcomes maps a label (a card name, REFUND or an Easter egg option) to its
+    probability; cards maps card codes to theirs. ev and variance are of the
+    coins made by opening the pack, opening any egg packs it yields and selling
+    every card; the pack's price is not subtracted.
+    """
+    pack_name: str
+    outcomes: dict
+    cards: dict
+    refund: float
+    easter_eggs: dict
+    ev: float
+    variance: float
+
+    @property
+    def std_dev(self):
+        return self.variance ** 0.5
+
+    def net_ev(self, cost_in_coins):
+        """Expected profit of buying the pack at cost_in_coins."""
+        return self.ev - cost_in_coins
+
+
+def variant_probabilities(rarity):
+    """Return {variant_id: probability} for a card of the given rarity."""
+    # Cold packs already give cold cards, so they never roll a variant
+    if "cold" in rarity.lower():
+        return {VARIANT_NONE: 1.0}
+    shadow, shiny, cold = config.SHADOW_CHANCE, config.SHINY_CHANCE, config.COLD_CHANCE
+    return {
+        VARIANT_SHADOW: shadow,
+        VARIANT_SHINY: shiny,
+        VARIANT_COLD: cold,
+        VARIANT_NONE: 1.0 - shadow - shiny - cold,
+    }
+
+
+def _immediate_odds(pack_name):
+    """Return (cards, refund, easter_eggs) probabilities for one opening of a pack."""
+    refund = config.REFUND_CHANCE
+    easter_egg = (1.0 - refund) * config.EASTER_EGG_CHANCE
+    card = 1.0 - refund - easter_egg
+
+    egg_weights = config.EASTER_EGG_OPTIONS
+    egg_total = sum(egg_weights.values())
+    easter_eggs = {option: easter_egg * weight / egg_total for option, weight in egg_weights.items()}
+
+    distribution = config.CARD_PACKS[pack_name]["rarity_distribution"]
+    total = sum(distribution.values())
+    cards = {}
+    for rarity, weight in distribution.items():
+        rarity_probability = card * weight / total
+        for variant, probability in variant_probabilities(rarity).items():
+            if probability > 0:
+                code = card_code(RARITY_IDS[rarity], variant)
+                cards[code] = cards.get(code, 0.0) + rarity_probability * probability
+    return cards, refund, easter_eggs
+
+
+class OddsCalculator:
+    """Per-pack odds for the whole catalog, worked out on first use and then cached.
+
+    The catalog is read-only, so the odds are not checked against it again;
+    anything that patches the config (a test, a what-if script) calls clear().
+    """
+
+    def __init__(self):
+        self._odds = None
+
+    def _current(self):
+        if self._odds is None:
+            self._odds = self._compute()
+        return self._odds
+
+    def clear(self):
+        """Forget the cached odds."""
+        self._odds = None
+
+    def pack(self, pack_name):
+        """Return the PackOdds of one pack."""
+        return self._current()[pack_name]
+
+    def all_packs(self):
+        """Return {pack_name: PackOdds} for every pack in CARD_PACKS."""
+        return dict(self._current())
+
+    def value_distribution(self, pack_name, min_probability=1e-12):
+        """Return {coins: probability} for opening one pack and selling everything.
+
+        Easter egg packs are expanded into their own distributions; branches less
+        likely than min_probability are dropped, so the total can fall just short of 1.
+        """
+        distribution = {}
+        pending = [(pack_name, 1.0)]
+        while pending:
+            name, weight = pending.pop()
+            odds = self.pack(name)
+            for coins, probability in _direct_values(odds):
+                distribution[coins] = distribution.get(coins, 0.0) + weight * probability
+            for option, probability in odds.easter_eggs.items():
+                if option in config.CARD_PACKS and weight * probability >= min_probability:
+                    pending.append((option, weight * probability))
+        return distribution
+
+    def _compute(self):
+        immediate = {name: _immediate_odds(name) for name in config.CARD_PACKS}
+
+        # Coins settled directly by each pack (first and second moments), and its egg packs
+        direct = {}
+        for name, (cards, refund, easter_eggs) in immediate.items():
+            values = list(_direct_values_of(name, cards, refund, easter_eggs))
+            direct[name] = (
+                sum(p * v for v, p in values),
+                sum(p * v * v for v, p in values),
+                [(option, p) for option, p in easter_eggs.items() if option in config.CARD_PACKS],
+            )
+
+        # m = direct + sum(P(egg pack) * m[egg pack]); egg odds are tiny, so this converges fast
+        ev = {name: 0.0 for name in direct}
+        second = {name: 0.0 for name in direct}
+        for _ in range(100):
+            new_ev = {name: d1 + sum(p * ev[egg] for egg, p in eggs) for name, (d1, _d2, eggs) in direct.items()}
+            new_second = {name: d2 + sum(p * second[egg] for egg, p in eggs) for name, (_d1, d2, eggs) in direct.items()}
+            converged = new_ev == ev and new_second == second
+            ev, second = new_ev, new_second
+            if converged:
+                break
+
+        odds = {}
+        for name, (cards, refund, easter_eggs) in immediate.items():
+            outcomes = {card_name(code): p for code, p in cards.items()}
+            outcomes[REFUND] = refund
+            outcomes.update(easter_eggs)
+            odds[name] = PackOdds(name, outcomes, cards, refund, easter_eggs,
+                                  ev[name], max(0.0, second[name] - ev[name] ** 2))
+        return odds
+
+
+def _direct_values_of(pack_name, cards, refund, easter_eggs):
+    """Yield (coins, probability) for the outcomes that pay out without opening another pack."""
+    prices = pricing.PRICE_TABLE
+    for code, probability in cards.items():
+        yield prices[code], probability
+    yield config.CARD_PACKS[pack_name]["cost"] * 2, refund
+    for option, probability in easter_eggs.items():
+        if option == MILLION_COINS_EGG:
+            yield MILLION_COINS, probability
+        elif option not in config.CARD_PACKS:
+            yield 0, probability  # Nothing to open, so nothing to sell
+
+
+def _direct_values(odds):
+    return _direct_values_of(odds.pack_name, odds.cards, odds.refund, odds.easter_eggs)
+
+
+ODDS = OddsCalculator()
+
+
+def pack_odds(pack_name):
+    """Return the PackOdds of one pack under the current config."""
+    return ODDS.pack(pack_name)
+
+
+def expected_value(pack_name):
+    """Return the expected coins from opening one pack and selling everything."""
+    return ODDS.pack(pack_name).ev
+
+
+def main(argv=None):
+    from packsim.simulate import pack_cost_in_coins, purchasable_packs
+
+    parser = argparse.ArgumentParser(prog="python -m packsim.odds",
+                                     description="Print the exact expected value of every pack.")
+    parser.add_argument("pack_names", nargs="*", metavar="PACK", help="packs to show (default: every pack the shop sells)")
+    parser.add_argument("--check", type=int, metavar="PLAYERS", default=0,
+                        help="also simulate PLAYERS single-pack openings per pack and show how far off they are")
+    parser.add_argument("--seed", type=int, default=None, help="seed for --check")
+    args = parser.parse_args(argv)
+
+    pack_names = args.pack_names or purchasable_packs()
+    unknown = [name for name in pack_names if name not in config.CARD_PACKS]
+    if unknown:
+        parser.error(f"unknown pack(s): {', '.join(unknown)}")
+
+    reports = {}
+    if args.check:
+        from packsim.simulate import simulate
+        reports = {r.pack_name: r for r in simulate(pack_names, args.check, 1, seed=args.seed)}
+
+    for name in pack_names:
+        odds = pack_odds(name)
+        cost = pack_cost_in_coins(name)
+        line = f"{name:<14} EV {odds.ev:10.2f}  net {odds.net_ev(cost):10.2f}  std dev {odds.std_dev:10.2f}"
+        if name in reports:
+            # The simulator reports net coins, so add the cost back before comparing
+            simulated = reports[name].mean + cost
+            standard_error = odds.std_dev / args.check ** 0.5
+            line += f"  simulated {simulated:10.2f}  ({(simulated - odds.ev) / standard_error:+.2f} SE)"
+        print(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Card sell prices, resolved once per card code instead of once per card."""
+import operator
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # the game runs without NumPy, only bulk pricing is slower
+    np = None
+
+from packsim.cards import CARD_CODE_COUNT, Card, CardCollection
+from packsim.catalog import CATALOG, price_from_name  # price_from_name is re-exported
+from packsim.instrument import instrumented
+
+BASE_PRICES = CATALOG.base_prices
+
+# Price of every card code, so pricing a card is a single index (built by the catalog compiler)
+PRICE_TABLE = CATALOG.price_table
+assert len(PRICE_TABLE) == CARD_CODE_COUNT
+
+_PRICE_ARRAY = np.array(PRICE_TABLE, dtype=np.int64) if np is not None else None
+
+
+@instrumented("card_price")
+def card_price(card):
+    """Return the sell price of a card code or Card view."""
+    if isinstance(card, Card):
+        card = card.code
+    return PRICE_TABLE[card]
+
+
+def price_many(cards):
+    """Price a whole collection at once, returning one price per card.
+
+    cards may be a CardCollection or any sequence of card codes. With NumPy
+    installed this is a single vectorized call.
+    """
+    if isinstance(cards, CardCollection):
+        if _PRICE_ARRAY is not None:
+            return np.repeat(_PRICE_ARRAY, np.asarray(cards.counts, dtype=np.intp))
+        cards = cards.iter_codes()
+    elif _PRICE_ARRAY is not None:
+        return _PRICE_ARRAY[np.asarray(cards, dtype=np.intp)]
+    return array("q", map(PRICE_TABLE.__getitem__, cards))
+
+
+def total_price(cards):
+    """Return the combined sell price of a collection."""
+    if isinstance(cards, CardCollection):
+        # One multiply per card code, however many cards are held
+        return sum(map(operator.mul, PRICE_TABLE, cards.counts))
+    return int(sum(price_many(cards)))
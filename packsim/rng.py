@@ -0,0 +1,115 @@
+"""Seedable, splittable random streams, and a log to replay a session from its seed.
+
+An RngService is one stream, named by a root entropy value plus a spawn key,
+the same naming NumPy's SeedSequence uses. spawn() hands out children with
+distinct keys, so parallel workers get independent streams that are still
+fixed by the one root seed. Streams derive their seeds by hashing, so the game
+needs NumPy only if a batch engine asks for a Generator.
+"""
+import hashlib
+import pickle
+import secrets
+from random import Random
+
+from packsim.journal import write_atomic
+
+
+def _derive_seed(entropy, spawn_key):
+    """Hash entropy and spawn_key into a 256-bit seed for random.Random."""
+    text = ",".join(map(str, (entropy,) + tuple(spawn_key)))
+    return int.from_bytes(hashlib.sha256(text.encode()).digest(), "big")
+
+
+class RngService:
+    """One random stream of a seeded tree of streams.
+
+    random is a plain random.Random, so the single-open hot path pays nothing
+    for the service: GameState calls random.random() on it directly.
+    """
+
+    def __init__(self, entropy=None, spawn_key=()):
+        if entropy is None:
+            entropy = secrets.randbits(128)
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        self.random = Random(_derive_seed(entropy, self.spawn_key))
+        self._spawned = 0
+        self._generator = None
+
+    def spawn(self, n):
+        """Return n child streams, each independent of this one and of each other."""
+        start = self._spawned
+        self._spawned += n
+        return [RngService(self.entropy, self.spawn_key + (i,)) for i in range(start, start + n)]
+
+    def numpy(self):
+        """Return this stream's numpy Generator (created once, then shared)."""
+        if self._generator is None:
+            import numpy as np
+
+            seed = np.random.SeedSequence(self.entropy, spawn_key=self.spawn_key)
+            self._generator = np.random.default_rng(seed)
+        return self._generator
+
+    def seed_info(self):
+        """Return (entropy, spawn_key), enough to recreate this stream from its start."""
+        return self.entropy, self.spawn_key
+
+    @classmethod
+    def from_seed_info(cls, seed_info):
+        entropy, spawn_key = seed_info
+        return cls(entropy, spawn_key)
+
+    def __getstate__(self):
+        # Workers only need the name of the stream; they rebuild its state themselves
+        return {"entropy": self.entropy, "spawn_key": self.spawn_key, "_spawned": self._spawned}
+
+    def __setstate__(self, state):
+        self.__init__(state["entropy"], state["spawn_key"])
+        self._spawned = state["_spawned"]
+
+    def __repr__(self):
+        return f"RngService(entropy={self.entropy!r}, spawn_key={self.spawn_key!r})"
+
+
+class ReplayLog:
+    """The starting save, the RNG seed and every action of a session, in order.
+
+    Replaying the actions on a GameState rebuilt from start with the same seed
+    repeats every roll, so a reported result can be reproduced exactly.
+    """
+
+    def __init__(self, seed_info, start, actions=None):
+        self.seed_info = seed_info
+        self.start = start
+        self.actions = actions if actions is not None else []
+
+    @classmethod
+    def begin(cls, game):
+        """Start logging a game that draws from an RngService; returns the log."""
+        log = cls(game.rng_service.seed_info(), game.to_save(journal_seq=0))
+        game.replay_log = log
+        return log
+
+    def record(self, action, *args):
+        self.actions.append((action,) + args)
+
+    def replay(self, **kwargs):
+        """Rebuild the game from start and rerun every action; returns the new GameState."""
+        from packsim.game import GameError, GameState
+
+        game = GameState.from_save(self.start, rng=RngService.from_seed_info(self.seed_info), **kwargs)
+        for action, *args in self.actions:
+            try:
+                getattr(game, action)(*args)
+            except GameError:
+                pass  # It failed the first time too
+        return game
+
+    def save(self, filename):
+        write_atomic(filename, pickle.dumps((self.seed_info, self.start, self.actions)))
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            return cls(*pickle.load(f))
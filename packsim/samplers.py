@@ -0,0 +1,100 @@
+"""Walker/Vose alias tables so drawing a rarity costs the same however many rarities a pack has."""
+import random
+
+from packsim.catalog import CATALOG, alias_tables
+from packsim.config import CARD_PACKS, EASTER_EGG_OPTIONS
+
+
+class AliasSampler:
+    """Draws keys of a {outcome: weight} dict in O(1) using Vose's alias method."""
+
+    __slots__ = ("outcomes", "prob", "alias", "_size", "_arrays")
+
+    def __init__(self, distribution):
+        self.outcomes = tuple(distribution)
+        self.prob, self.alias = alias_tables(list(distribution.values()))
+        self._size = len(self.prob)
+        self._arrays = None
+
+    @classmethod
+    def from_tables(cls, outcomes, prob, alias):
+        """Wrap alias tables the catalog compiler already built."""
+        sampler = cls.__new__(cls)
+        sampler.outcomes = tuple(outcomes)
+        sampler.prob = tuple(prob)
+        sampler.alias = tuple(alias)
+        sampler._size = len(sampler.prob)
+        sampler._arrays = None
+        return sampler
+
+    def draw_index(self, rng=random):
+        """Draw the index of one outcome using a single rng.random() call."""
+        u = rng.random() * self._size
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def draw(self, rng=random):
+        """Draw one outcome key."""
+        return self.outcomes[self.draw_index(rng)]
+
+    def draw_indices(self, n, rng):
+        """Draw n outcome indices at once from a numpy Generator."""
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (np.array(self.prob), np.array(self.alias, dtype=np.intp))
+        prob, alias = self._arrays
+        u = rng.random(n) * self._size
+        i = u.astype(np.intp)
+        return np.where(u - i < prob[i], i, alias[i])
+
+
+class SamplerRegistry:
+    """Alias samplers for every pack plus the Easter egg table, built once per definition.
+
+    The catalog is read-only, so a sampler is never checked against it again
+    on a draw; anything that swaps in new definitions calls clear().
+    """
+
+    def __init__(self, card_packs, easter_egg_options):
+        self.card_packs = card_packs
+        self.easter_egg_options = easter_egg_options
+        self._packs = {}
+        self._easter_egg = None
+
+    def build_all(self):
+        """Build every sampler up front so the first pack opening pays nothing extra."""
+        for pack_name in self.card_packs:
+            self.pack(pack_name)
+        self.easter_egg()
+        return self
+
+    def pack(self, pack_name):
+        """Return the sampler for a pack's rarity_distribution."""
+        sampler = self._packs.get(pack_name)
+        if sampler is None:
+            sampler = AliasSampler(self.card_packs[pack_name]["rarity_distribution"])
+            self._packs[pack_name] = sampler
+        return sampler
+
+    def easter_egg(self):
+        """Return the sampler for EASTER_EGG_OPTIONS."""
+        if self._easter_egg is None:
+            self._easter_egg = AliasSampler(self.easter_egg_options)
+        return self._easter_egg
+
+    def load_tables(self, sampler_tables, easter_egg_table):
+        """Use precompiled alias tables instead of building them; returns self."""
+        for pack_name, tables in sampler_tables.items():
+            self._packs[pack_name] = AliasSampler.from_tables(*tables)
+        self._easter_egg = AliasSampler.from_tables(*easter_egg_table)
+        return self
+
+    def clear(self):
+        """Drop every cached sampler, e.g. after replacing card_packs or easter_egg_options."""
+        self._packs.clear()
+        self._easter_egg = None
+
+
+SAMPLERS = SamplerRegistry(CARD_PACKS, EASTER_EGG_OPTIONS).load_tables(
+    CATALOG.sampler_tables, CATALOG.easter_egg_table)
@@ -0,0 +1,139 @@
+"""Reading and writing save files, upgrading older layouts to the current save tuple.
+
+The save tuple is (coins, snow, packs, cards, net_worth, total_packs_opened,
+total_cards_sold, easter_eggs_found, experience_points, journal_seq), as built
+by GameState.to_save. Its layout is versioned: SAVE_VERSION is the current
+one, and an upgrade function registered with @upgrades(n) turns a version n
+tuple into a version n + 1 tuple.
+
+Saves are written in the binary format of packsim.codec, or the columnar
+format for names ending in COLUMNAR_SUFFIX. Pickled saves from older games
+are still read (they carry no version, so it is told from their length) and
+are written back in the binary format on the next save. They are unpickled
+with _LegacyUnpickler, which only builds the plain types a save holds, so a
+crafted file cannot run code.
+"""
+import io
+import logging
+import os
+import pickle
+
+from packsim.codec import decode_save, encode_save, is_binary_save
+from packsim.columnar import load_columnar, save_columnar
+from packsim.instrument import instrumented
+from packsim.journal import write_atomic
+
+SAVE_VERSION = 3
+
+# Saves ending in COLUMNAR_SUFFIX use the memory-mapped columnar format instead
+COLUMNAR_SUFFIX = ".pksc"
+
+# Compression for binary saves: "none", "zlib" or "lzma"
+SAVE_COMPRESSION = "zlib"
+
+# read_save reads a save in chunks this big, reporting progress after each
+READ_CHUNK = 1 << 20
+
+# Pickled saves from before versioning, told apart by their length
+_PICKLE_VERSIONS = {4: 1, 9: 2, 10: 3}
+
+# The only globals a pickled save may refer to: the plain types and what an array pickles as
+_LEGACY_GLOBALS = {
+    ("builtins", "tuple"), ("builtins", "list"), ("builtins", "dict"),
+    ("builtins", "str"), ("builtins", "int"),
+    ("array", "array"), ("array", "_array_reconstructor"),
+}
+
+_UPGRADES = {}
+
+log = logging.getLogger(__name__)
+
+
+def upgrades(version):
+    """Register a function that upgrades a version-numbered save tuple to the next version."""
+    def register(func):
+        _UPGRADES[version] = func
+        return func
+    return register
+
+
+@upgrades(1)
+def _add_stats(data):
+    # The first saves held only the balances, packs and cards
+    player_currency, player_snow, player_inventory, player_cards = data
+    net_worth = player_currency  # Default net worth calculation
+    return (player_currency, player_snow, player_inventory, player_cards, net_worth, 0, 0, 0, 0)
+
+
+@upgrades(2)
+def _add_journal_seq(data):
+    # Saves from before the journal have no journal sequence number
+    return tuple(data) + (0,)
+
+
+@instrumented("save_game")
+def write_save(data, filename, compression=None):
+    """Write a save tuple, replacing the old file atomically."""
+    if filename.endswith(COLUMNAR_SUFFIX):
+        save_columnar(data, filename)
+    else:
+        write_atomic(filename, encode_save(data, SAVE_VERSION, compression or SAVE_COMPRESSION))
+    log.debug("Saved %s", filename)
+
+
+def upgrade_save(data, version=None):
+    """Upgrade a save tuple of the given version (or an unversioned pickled one) to SAVE_VERSION."""
+    if version is None:
+        version = _PICKLE_VERSIONS.get(len(data))
+        if version is None:
+            raise ValueError(f"Unrecognized save with {len(data)} fields")
+    if version > SAVE_VERSION:
+        raise ValueError(f"The save is from a newer version of the game (save version {version})")
+    while version < SAVE_VERSION:
+        data = _UPGRADES[version](data)
+        version += 1
+    return data
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    """Unpickles an old save, refusing anything but the types in _LEGACY_GLOBALS."""
+
+    def find_class(self, module, name):
+        if (module, name) not in _LEGACY_GLOBALS:
+            raise pickle.UnpicklingError(f"A save cannot contain {module}.{name}; it may have been tampered with.")
+        return super().find_class(module, name)
+
+
+@instrumented("load_game")
+def read_save(filename, progress=None):
+    """Read a save file and return the current save tuple; raises FileNotFoundError.
+
+    progress, if given, is called as progress(bytes read, file size) while the
+    file is read. A columnar save is mapped rather than read, so it reports once.
+    Anything that is not a binary or columnar save is read as an old pickled
+    save; one that refers to anything but plain data raises pickle.UnpicklingError.
+    """
+    if filename.endswith(COLUMNAR_SUFFIX):
+        data = load_columnar(filename)
+        if progress is not None:
+            size = os.path.getsize(filename)
+            progress(size, size)
+        return data
+
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        chunks = []
+        done = 0
+        while True:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, size)
+    raw = b"".join(chunks)
+    if is_binary_save(raw):
+        version, data = decode_save(raw)
+        return upgrade_save(data, version)
+    return upgrade_save(_LegacyUnpickler(io.BytesIO(raw)).load())
@@ -0,0 +1,47 @@
+"""Screen switching for the Tk app without tearing widgets down."""
+import tkinter as tk
+
+from packsim.instrument import METRICS
+
+
+class ScreenManager:
+    """Builds each screen once and switches between them by raising its frame.
+
+    register(name, build, on_show) adds a screen: build(frame) fills an empty
+    frame the first time the screen is shown, and on_show(), if given, runs on
+    every show to update what changed (StringVars, list counts) in place.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.container = tk.Frame(root)
+        self.container.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.current = None
+        self._screens = {}
+        self._frames = {}
+
+    def register(self, name, build, on_show=None):
+        self._screens[name] = (build, on_show)
+
+    def frame(self, name):
+        """Return a screen's frame, building it if it has never been shown."""
+        frame = self._frames.get(name)
+        if frame is None:
+            build, _ = self._screens[name]
+            frame = tk.Frame(self.container)
+            frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+            with METRICS.timed(f"screen build: {name}"):
+                build(frame)
+            self._frames[name] = frame
+        return frame
+
+    def show(self, name):
+        """Bring a screen to the front, refreshing it first."""
+        frame = self.frame(name)
+        on_show = self._screens[name][1]
+        if on_show is not None:
+            with METRICS.timed(f"screen refresh: {name}"):
+                on_show()
+        frame.tkraise()
+        self.current = name
+        return frame
@@ -0,0 +1,236 @@
+"""Monte Carlo economy simulator: how many coins does a pack-buying strategy make?
+
+Each strategy buys one pack type, opens it, opens any Easter egg packs it finds
+and sells every card. Simulated players are split into fixed-size shards that
+run on a process pool, each with its own seeded random stream, so a run gives
+the same numbers whatever --jobs is set to.
+
+    python -m packsim.simulate --players 100000 --packs 100 "Ruby Pack" "Gold Pack"
+"""
+import argparse
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from packsim.batch import open_packs
+from packsim.cards import VARIANT_BITS
+from packsim.config import CARD_PACKS
+from packsim.game import COIN_REWARD, COINS_PER_SNOW, MILLION_COINS, OUTCOME_CARD, OUTCOME_REFUND, OUTCOME_EASTER_EGG
+from packsim.pricing import PRICE_TABLE
+from packsim.rng import RngService
+from packsim.samplers import SAMPLERS
+
+# Players per shard. Fixed, so the shard seeds (and results) do not depend on the pool size
+SHARD_PLAYERS = 10_000
+
+# Packs rolled per NumPy call; bounds a worker's memory however many packs a player opens
+CHUNK_PACKS = 1_000_000
+
+# The game pays COIN_REWARD every 2 minutes
+REWARD_PER_HOUR = COIN_REWARD * 30
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+_PRICES = np.array(PRICE_TABLE, dtype=np.int64)
+
+
+def purchasable_packs():
+    """Return the names of the packs the shop sells."""
+    return [name for name, info in CARD_PACKS.items() if info.get("purchasable", True)]
+
+
+def pack_cost_in_coins(pack_name):
+    """Return what one pack costs, with Snow counted at the conversion rate."""
+    info = CARD_PACKS[pack_name]
+    if info["currency"] == "snow":
+        return info["cost"] * COINS_PER_SNOW
+    return info["cost"]
+
+
+def _open_and_sell(pack_name, owners, totals, rng):
+    """Open one pack for each entry of owners and add the coins made to totals[owner].
+
+    Easter egg packs found along the way are opened too (they are never bought),
+    so one call settles everything the packs turn into.
+    """
+    egg_outcomes = SAMPLERS.easter_egg().outcomes
+    pending = [(pack_name, owners)]
+    while pending:
+        name, owners = pending.pop()
+        results = open_packs(name, len(owners), rng)
+        outcome = results["outcome"]
+
+        coins = np.zeros(len(owners), dtype=np.int64)
+        card = outcome == OUTCOME_CARD
+        codes = (results["rarity"][card].astype(np.intp) << VARIANT_BITS) | results["variant"][card]
+        coins[card] = _PRICES[codes]
+        coins[outcome == OUTCOME_REFUND] = CARD_PACKS[name]["cost"] * 2
+
+        eggs = results["egg"]
+        easter_egg = outcome == OUTCOME_EASTER_EGG
+        for index, egg_name in enumerate(egg_outcomes):
+            found = easter_egg & (eggs == index)
+            if not found.any():
+                continue
+            if egg_name == "Million Coins":
+                coins[found] = MILLION_COINS
+            else:
+                pending.append((egg_name, owners[found]))
+
+        np.add.at(totals, owners, coins)
+
+
+def run_shard(pack_name, players, packs_per_player, stream):
+    """Simulate one shard of players and return a histogram of their net coins.
+
+    stream is the shard's RngService. Returns (values, counts) arrays: counts[i]
+    players finished values[i] coins up.
+    """
+    rng = stream.numpy()
+    totals = np.zeros(players, dtype=np.int64)
+
+    # Whole players per chunk, so every owner index stays inside this shard
+    players_per_chunk = max(1, CHUNK_PACKS // max(1, packs_per_player))
+    for start in range(0, players, players_per_chunk):
+        stop = min(players, start + players_per_chunk)
+        owners = np.repeat(np.arange(start, stop), packs_per_player)
+        _open_and_sell(pack_name, owners, totals, rng)
+
+    totals -= pack_cost_in_coins(pack_name) * packs_per_player
+    return np.unique(totals, return_counts=True)
+
+
+class StrategyReport:
+    """Summary statistics of one strategy, built from a merged histogram of player results."""
+
+    def __init__(self, pack_name, packs_per_player, histogram, percentiles=DEFAULT_PERCENTILES):
+        self.pack_name = pack_name
+        self.packs_per_player = packs_per_player
+        self.histogram = histogram
+
+        # Exact Python ints: a few Million Coins eggs would overflow int64 squares
+        self.players = sum(histogram.values())
+        total = sum(value * count for value, count in histogram.items())
+        self.mean = total / self.players
+        self.variance = sum(count * (value - self.mean) ** 2 for value, count in histogram.items()) / self.players
+        self.percentiles = dict(zip(percentiles, _histogram_percentiles(histogram, percentiles)))
+
+    @property
+    def std_dev(self):
+        return self.variance ** 0.5
+
+    @property
+    def ev_per_pack(self):
+        return self.mean / self.packs_per_player
+
+    def coins_per_hour(self, packs_per_hour):
+        """Expected coins per hour when opening packs_per_hour packs, plus the timed reward."""
+        return self.ev_per_pack * packs_per_hour + REWARD_PER_HOUR
+
+
+def _histogram_percentiles(histogram, percentiles):
+    """Return the nearest-rank percentiles of a {value: count} histogram."""
+    values = sorted(histogram)
+    players = sum(histogram.values())
+    ranks = [max(1, -(-p * players // 100)) for p in percentiles]
+
+    results = []
+    seen = 0
+    i = 0
+    for value in values:
+        seen += histogram[value]
+        while i < len(ranks) and ranks[i] <= seen:
+            results.append(value)
+            i += 1
+    return results
+
+
+def simulate(pack_names, players, packs_per_player, seed=None, jobs=None, percentiles=DEFAULT_PERCENTILES):
+    """Run every strategy and return one StrategyReport per pack name, in order.
+
+    Shards of all strategies share one process pool; jobs=1 runs them in this process.
+    """
+    root = RngService(seed)
+    shard_sizes = [SHARD_PLAYERS] * (players // SHARD_PLAYERS)
+    if players % SHARD_PLAYERS:
+        shard_sizes.append(players % SHARD_PLAYERS)
+
+    # One independent stream per strategy, split again per shard
+    tasks = []
+    for pack_name, strategy_stream in zip(pack_names, root.spawn(len(pack_names))):
+        for size, shard_stream in zip(shard_sizes, strategy_stream.spawn(len(shard_sizes))):
+            tasks.append((pack_name, size, packs_per_player, shard_stream))
+
+    histograms = {pack_name: Counter() for pack_name in pack_names}
+    if jobs == 1:
+        shard_results = (run_shard(*task) for task in tasks)
+        _merge(histograms, tasks, shard_results)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            shard_results = pool.map(run_shard, *zip(*tasks))
+            _merge(histograms, tasks, shard_results)
+
+    return [StrategyReport(pack_name, packs_per_player, histograms[pack_name], percentiles)
+            for pack_name in pack_names]
+
+
+def _merge(histograms, tasks, shard_results):
+    for task, (values, counts) in zip(tasks, shard_results):
+        histograms[task[0]].update(dict(zip(values.tolist(), counts.tolist())))
+
+
+def format_reports(reports, packs_per_hour):
+    """Return the reports as a plain-text table."""
+    percentiles = list(reports[0].percentiles) if reports else []
+    header = ["Pack", "Cost", "EV/pack", "EV/player", "Std dev"] + [f"p{p}" for p in percentiles] + ["Coins/hour"]
+    rows = [header]
+    for report in reports:
+        rows.append(
+            [report.pack_name, str(pack_cost_in_coins(report.pack_name)),
+             f"{report.ev_per_pack:.1f}", f"{report.mean:.1f}", f"{report.std_dev:.1f}"]
+            + [str(report.percentiles[p]) for p in percentiles]
+            + [f"{report.coins_per_hour(packs_per_hour):.0f}"]
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m packsim.simulate",
+        description="Simulate players who buy one pack type, open it and sell every card.",
+    )
+    parser.add_argument("packs_to_buy", nargs="*", metavar="PACK",
+                        help="pack names to simulate (default: every pack the shop sells)")
+    parser.add_argument("--players", type=int, default=100_000, help="simulated players per pack (default: %(default)s)")
+    parser.add_argument("--packs", type=int, default=100, help="packs each player opens (default: %(default)s)")
+    parser.add_argument("--packs-per-hour", type=float, default=60,
+                        help="packs opened per hour, for the coins/hour column (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU; 1 runs in-process)")
+    args = parser.parse_args(argv)
+
+    pack_names = args.packs_to_buy or purchasable_packs()
+    unknown = [name for name in pack_names if name not in CARD_PACKS]
+    if unknown:
+        parser.error(f"unknown pack(s): {', '.join(unknown)}")
+    if args.players < 1 or args.packs < 1:
+        parser.error("--players and --packs must be at least 1")
+
+    reports = simulate(pack_names, args.players, args.packs, seed=args.seed, jobs=args.jobs)
+    print(f"{args.players} players x {args.packs} packs, "
+          f"{args.jobs or os.cpu_count()} worker(s), selling every card; Snow counted as {COINS_PER_SNOW} coins")
+    print(format_reports(reports, args.packs_per_hour))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Tk widgets shared by the game screens."""
+import tkinter as tk
+
+
+class VirtualList(tk.Frame):
+    """Scrollable list that only creates widgets for the rows in view.
+
+    make_row(parent) builds one empty row widget and fill_row(row, index)
+    points it at item index. A fixed pool of rows (one per visible line) is
+    reused as the list scrolls, so building the list costs the same for ten
+    items as for ten million.
+    """
+
+    def __init__(self, master, make_row, fill_row, row_height=40, **kwargs):
+        kwargs.setdefault("height", row_height * 10)
+        kwargs.setdefault("width", 600)
+        super().__init__(master, **kwargs)
+        self.pack_propagate(False)  # Keep the requested size; rows are placed, not packed
+        self.make_row = make_row
+        self.fill_row = fill_row
+        self.row_height = row_height
+        self.count = 0
+        self.top = 0
+        self._rows = []
+
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.body = tk.Frame(self)
+        self.body.pack(side="left", fill="both", expand=True)
+
+        self.body.bind("<Configure>", lambda event: self.refresh())
+        # Only capture the mouse wheel while the pointer is over the list
+        self.bind("<Enter>", self._bind_wheel)
+        self.bind("<Leave>", self._unbind_wheel)
+
+    def set_count(self, count):
+        """Change the number of items and redraw the visible rows."""
+        self.count = count
+        self.scroll_to(self.top)
+
+    def scroll_to(self, top):
+        """Make item top the first visible row (clamped to the list)."""
+        self.top = max(0, min(top, self.count - self.visible_rows()))
+        self.refresh()
+
+    def visible_rows(self):
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def refresh(self):
+        """Repoint the row pool at the items currently in view."""
+        visible = self.visible_rows()
+        while len(self._rows) < visible:
+            self._rows.append(self.make_row(self.body))
+
+        for slot, row in enumerate(self._rows):
+            index = self.top + slot
+            if slot < visible and index < self.count:
+                self.fill_row(row, index)
+                row.place(x=0, y=slot * self.row_height, relwidth=1, height=self.row_height)
+            else:
+                row.place_forget()
+
+        if self.count:
+            self.scrollbar.set(self.top / self.count, min(1.0, (self.top + visible) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.count))
+        elif action == "scroll":
+            step = self.visible_rows() if unit == "pages" else 1
+            self.scroll_to(self.top + int(amount) * step)
+
+    def _on_mouse_wheel(self, event):
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.scroll_to(self.top + delta * 3)
+
+    def _bind_wheel(self, event):
+        self.bind_all("<MouseWheel>", self._on_mouse_wheel)
+        self.bind_all("<Button-4>", self._on_mouse_wheel)
+        self.bind_all("<Button-5>", self._on_mouse_wheel)
+
+    def _unbind_wheel(self, event):
+        self.unbind_all("<MouseWheel>")
+        self.unbind_all("<Button-4>")
+        self.unbind_all("<Button-5>")